@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 import re
 import threading
 from dataclasses import dataclass
@@ -9,6 +10,8 @@ from typing import Any, Dict, Iterable, Mapping, Sequence
 
 import yaml
 
+LOGGER = logging.getLogger(__name__)
+
 _CONFIG_PATH = Path(__file__).resolve().parents[2] / "config" / "keywords.yml"
 _REGISTRY_LOCK = threading.Lock()
 _REGISTRY_CACHE: "KeywordRegistry | None" = None
@@ -22,11 +25,15 @@ def _normalize_phrase(value: str) -> str:
     return normalized
 
 
-def _phrase_in_text(phrase: str, text: str) -> bool:
-    if phrase == text:
-        return True
-    pattern = re.compile(rf"\b{re.escape(phrase)}\b")
-    return bool(pattern.search(text))
+def _compile_phrase(phrase: str) -> re.Pattern[str]:
+    return re.compile(rf"\b{re.escape(phrase)}\b")
+
+
+def _compile_alternation(phrases: Iterable[str]) -> re.Pattern[str] | None:
+    ordered = sorted(phrases, key=len, reverse=True)
+    if not ordered:
+        return None
+    return re.compile(r"\b(?:" + "|".join(re.escape(phrase) for phrase in ordered) + r")\b")
 
 
 @dataclass(frozen=True)
@@ -53,6 +60,11 @@ class KeywordRegistry:
             "synonym": {},
             "typo": {},
         }
+        self._patterns: Dict[str, list[tuple[re.Pattern[str], str, str]]] = {
+            "exact": [],
+            "synonym": [],
+            "typo": [],
+        }
 
         for entry in entries:
             if entry.canonical_id in self._entries:
@@ -62,6 +74,12 @@ class KeywordRegistry:
             self._register_terms(entry, "synonym", entry.synonyms)
             self._register_terms(entry, "typo", entry.typos)
 
+        # One combined scan per mode rejects queries that mention no phrase of
+        # that mode before falling back to the ordered per-phrase patterns.
+        self._mode_patterns: Dict[str, re.Pattern[str] | None] = {
+            mode: _compile_alternation(lookup) for mode, lookup in self._lookups.items()
+        }
+
     def _register_terms(
         self,
         entry: KeywordEntry,
@@ -69,6 +87,7 @@ class KeywordRegistry:
         phrases: Iterable[str],
     ) -> None:
         lookup = self._lookups[mode]
+        patterns = self._patterns[mode]
         for phrase in phrases:
             normalized = _normalize_phrase(phrase)
             if normalized in lookup:
@@ -78,6 +97,7 @@ class KeywordRegistry:
                     f"already registered by '{existing_id}' as '{existing_phrase}'",
                 )
             lookup[normalized] = (entry.canonical_id, phrase)
+            patterns.append((_compile_phrase(normalized), entry.canonical_id, phrase))
 
     def match(self, query: str) -> tuple[KeywordEntry, str, str] | None:
         normalized_query = _normalize_phrase(query)
@@ -88,8 +108,11 @@ class KeywordRegistry:
                 return self._entries[canonical_id], phrase, mode
 
         for mode in ("exact", "synonym", "typo"):
-            for normalized_phrase, (canonical_id, phrase) in self._lookups[mode].items():
-                if _phrase_in_text(normalized_phrase, normalized_query):
+            mode_pattern = self._mode_patterns[mode]
+            if mode_pattern is None or not mode_pattern.search(normalized_query):
+                continue
+            for pattern, canonical_id, phrase in self._patterns[mode]:
+                if pattern.search(normalized_query):
                     return self._entries[canonical_id], phrase, mode
         return None
 
@@ -202,3 +225,13 @@ def validate_only(query: str, *, lenient: bool = False) -> dict[str, str] | None
             return None
         raise ValueError(f"Unapproved keyword detected: {query!r}")
     return match
+
+
+# Build the default registry at import time so YAML parsing and pattern
+# compilation happen during cold-start initialisation rather than on the
+# first lookup. A missing or invalid file is logged here and raised again on
+# first use.
+try:
+    load_keywords()
+except (OSError, ValueError, yaml.YAMLError) as exc:
+    LOGGER.warning("Could not preload keyword registry from %s: %s", _CONFIG_PATH, exc)
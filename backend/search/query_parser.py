@@ -4,7 +4,7 @@ import re
 from dataclasses import dataclass
 from typing import Any, Literal, Mapping
 
-from .keyword_registry import KeywordRegistry, load_keywords, resolve
+from .keyword_registry import KeywordRegistry, load_keywords
 
 STRICT = "STRICT"
 LENIENT = "LENIENT"
@@ -74,15 +74,15 @@ def parse(
 
     policy_value = _normalize_policy(policy)
     registry = registry or load_keywords()
-    match = resolve(query, registry=registry)
+    match = registry.match(query)
 
     if match is None:
         if policy_value == LENIENT:
             return None
         raise ValueError(f"Query does not contain an approved keyword: {query!r}")
 
-    entry = registry.get(match["canonical_id"])
-    remainder_tokens = _extract_remainder_tokens(query, match["matched_term"])
+    entry, matched_term, mode = match
+    remainder_tokens = _extract_remainder_tokens(query, matched_term)
     if policy_value == STRICT:
         must_not = remainder_tokens
         ignored: tuple[str, ...] = ()
@@ -92,11 +92,13 @@ def parse(
 
     return ParsedQuery(
         canonical_id=entry.canonical_id,
-        matched_term=match["matched_term"],
-        mode=match["mode"],
-        filters=dict(entry.filters),
-        boosts=dict(entry.boosts),
-        rerank=dict(entry.rerank),
+        matched_term=matched_term,
+        mode=mode,
+        # Entry mappings are read-only proxies, so they are shared rather than
+        # copied; to_dict() materializes them at the serialization boundary.
+        filters=entry.filters,
+        boosts=entry.boosts,
+        rerank=entry.rerank,
         negative_terms=entry.negative_terms,
         must_not=must_not,
         ignored=ignored,
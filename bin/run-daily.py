@@ -10,6 +10,8 @@ Usage:
     ./bin/run-daily.py --dry-run
     ./bin/run-daily.py --provider bing --keywords "parp,isg"
     ./bin/run-daily.py --reset-state
+    ./bin/run-daily.py --buffer-emails
+    ./bin/run-daily.py --flush-emails
 
 Exit codes:
     0: Success
@@ -26,10 +28,9 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.config_loader import load_config, load_config_with_env_fallback
-from src.crawler import BingCrawler, HttpCrawler
-from src.emailer import Emailer, EmailStats
-from src.storage import SeenStorage
+from src.config_loader import load_config, load_config_with_env_fallback, split_csv
+from src.emailer import BufferedEmailer, Emailer, EmailStats
+from src.storage import open_storage
 
 # Configure logging
 logging.basicConfig(
@@ -55,6 +56,8 @@ Examples:
   %(prog)s --provider bing              # Use Bing search
   %(prog)s --keywords "parp,isg,sting"  # Override keywords
   %(prog)s --min-results 5              # Require 5+ results
+  %(prog)s --buffer-emails              # Queue results for the next digest
+  %(prog)s --flush-emails               # Send queued results as one digest
         """
     )
 
@@ -96,6 +99,18 @@ Examples:
         help="Override minimum results threshold"
     )
 
+    parser.add_argument(
+        "--buffer-emails",
+        action="store_true",
+        help="Queue results in the pending digest instead of emailing immediately"
+    )
+
+    parser.add_argument(
+        "--flush-emails",
+        action="store_true",
+        help="Send queued results whose buffering window has elapsed as one digest, then exit"
+    )
+
     parser.add_argument(
         "--verbose",
         "-v",
@@ -107,7 +122,8 @@ Examples:
         "--storage-path",
         type=str,
         default=".data/seen.json",
-        help="Path to deduplication storage file (default: .data/seen.json)"
+        help="Path to deduplication storage file; a .db/.sqlite suffix selects "
+             "the SQLite backend (default: .data/seen.json)"
     )
 
     return parser.parse_args()
@@ -123,27 +139,27 @@ def load_configuration(args):
     Returns:
         Tuple of (config, keywords, provider, min_results)
     """
-    logger.info(f"Loading configuration from {args.config}")
+    logger.info("Loading configuration from %s", args.config)
 
     config_path = Path(args.config)
     if config_path.exists():
         config = load_config(config_path)
         logger.info("✓ Configuration loaded from config.yaml")
     else:
-        logger.warning(f"Config file not found: {args.config}, using environment variables")
+        logger.warning("Config file not found: %s, using environment variables", args.config)
         config = load_config_with_env_fallback()
 
     # Apply command-line overrides
     keywords = config.keywords
     if args.keywords:
-        keywords = [k.strip() for k in args.keywords.split(',')]
-        logger.info(f"Keywords overridden via CLI: {keywords}")
+        keywords = split_csv(args.keywords)
+        logger.info("Keywords overridden via CLI: %s", keywords)
 
     provider = args.provider or config.provider
-    logger.info(f"Provider: {provider}")
+    logger.info("Provider: %s", provider)
 
     min_results = args.min_results if args.min_results is not None else config.min_results
-    logger.info(f"Min results threshold: {min_results}")
+    logger.info("Min results threshold: %d", min_results)
 
     return config, keywords, provider, min_results
 
@@ -163,27 +179,33 @@ def perform_crawl(provider, keywords, config):
     Raises:
         RuntimeError: If crawling fails
     """
-    logger.info(f"Initializing {provider} crawler...")
+    logger.info("Initializing %s crawler...", provider)
 
+    # Crawler modules pull in requests/bs4, so import only the one in use
     if provider == "bing":
+        from src.crawler import BingCrawler
+
         crawler = BingCrawler()
         logger.info("✓ Bing crawler initialized")
     elif provider == "http":
         if not config.sources:
             raise ValueError("HTTP provider requires 'sources' in config.yaml")
+        from src.crawler import HttpCrawler
+
         crawler = HttpCrawler(
             source_urls=config.sources,
             respect_robots_txt=True
         )
-        logger.info(f"✓ HTTP crawler initialized ({len(config.sources)} sources)")
+        logger.info("✓ HTTP crawler initialized (%d unique sources)", len(config.sources_set))
     else:
         raise ValueError(f"Unknown provider: {provider}")
 
     # Perform search
-    logger.info(f"Searching for keywords: {keywords}")
-    results = crawler.search(keywords)
+    logger.info("Searching for keywords: %s", keywords)
+    with crawler:
+        results = crawler.search(keywords)
 
-    logger.info(f"Crawling complete: {len(results)} results found")
+    logger.info("Crawling complete: %d results found", len(results))
     return results
 
 
@@ -193,28 +215,48 @@ def apply_deduplication(results, storage):
 
     Args:
         results: List of ResultItem objects
-        storage: SeenStorage instance
+        storage: SeenStorage instance (BloomSeenStorage answers new items
+            from its filter without reading the JSON store)
 
     Returns:
         Tuple of (new_results, duplicates_count)
     """
     original_count = len(results)
-    new_results = [item for item in results if not storage.is_seen(item)]
+    seen_flags = storage.batch_is_seen(results)
+    new_results = [item for item, seen in zip(results, seen_flags) if not seen]
 
     duplicates_count = original_count - len(new_results)
 
-    logger.info(f"Deduplication: {original_count} total, {len(new_results)} new, "
-               f"{duplicates_count} duplicates")
+    logger.info("Deduplication: %d total, %d new, %d duplicates",
+                original_count, len(new_results), duplicates_count)
 
     # Mark new results as seen
     if new_results:
         storage.mark_seen(new_results)
-        logger.info(f"✓ Marked {len(new_results)} results as seen")
+        logger.info("✓ Marked %d results as seen", len(new_results))
 
     return new_results, duplicates_count
 
 
-def send_notification(results, keywords, original_count, duplicates_count, config, min_results):
+def create_emailer(config):
+    """
+    Create the email sender from configuration.
+
+    Args:
+        config: Configuration object
+
+    Returns:
+        Emailer instance
+    """
+    return Emailer(
+        sender=config.email.sender,
+        recipients=config.email.recipients,
+        subject_prefix=config.email.subject_prefix,
+    )
+
+
+def send_notification(results, keywords, original_count, duplicates_count, config, min_results,
+                      buffered=False):
     """
     Send email notification.
 
@@ -225,18 +267,17 @@ def send_notification(results, keywords, original_count, duplicates_count, confi
         duplicates_count: Number of duplicates filtered
         config: Configuration object
         min_results: Minimum results threshold
+        buffered: Queue the results for the next digest instead of sending now
 
     Returns:
-        True if email was sent, False otherwise
+        True if email was sent (or queued), False otherwise
     """
     logger.info("Preparing email notification...")
 
     # Create emailer
-    emailer = Emailer(
-        sender=config.email.sender,
-        recipients=config.email.recipients,
-        subject_prefix=config.email.subject_prefix,
-    )
+    emailer = create_emailer(config)
+    if buffered:
+        emailer = BufferedEmailer(emailer)
 
     # Create stats
     stats = EmailStats()
@@ -269,11 +310,11 @@ def main():
         config, keywords, provider, min_results = load_configuration(args)
 
         # Initialize storage
-        storage = SeenStorage(
+        storage = open_storage(
             storage_path=args.storage_path,
             dedup_window_days=config.dedup_window_days
         )
-        logger.info(f"Storage initialized: {args.storage_path} (TTL: {config.dedup_window_days} days)")
+        logger.info("Storage initialized: %s (TTL: %d days)", args.storage_path, config.dedup_window_days)
 
         # Handle reset-state
         if args.reset_state:
@@ -282,6 +323,12 @@ def main():
             logger.info("✓ State reset complete")
             return 0
 
+        # Handle flush-emails
+        if args.flush_emails:
+            sent_count = BufferedEmailer(create_emailer(config)).flush()
+            logger.info("✓ Digest flush complete (%d results sent)", sent_count)
+            return 0
+
         # Step 1: Perform crawling
         logger.info("=" * 60)
         logger.info("STEP 1: CRAWLING")
@@ -312,13 +359,13 @@ def main():
 
         if args.dry_run:
             logger.info("DRY RUN MODE: Email notification skipped")
-            logger.info(f"Would send email with {len(new_results)} results to:")
+            logger.info("Would send email with %d results to:", len(new_results))
             for recipient in config.email.recipients:
-                logger.info(f"  - {recipient}")
+                logger.info("  - %s", recipient)
         else:
             if len(new_results) < min_results:
                 logger.info(
-                    f"Skipping email: {len(new_results)} results < min_results ({min_results})"
+                    "Skipping email: %d results < min_results (%d)", len(new_results), min_results
                 )
             else:
                 sent = send_notification(
@@ -327,10 +374,13 @@ def main():
                     original_count,
                     duplicates_count,
                     config,
-                    min_results
+                    min_results,
+                    buffered=args.buffer_emails,
                 )
 
-                if sent:
+                if sent and args.buffer_emails:
+                    logger.info("✓ Email notification queued for the next digest")
+                elif sent:
                     logger.info("✓ Email notification sent successfully")
                 else:
                     logger.warning("✗ Failed to send email notification")
@@ -339,13 +389,21 @@ def main():
         logger.info("=" * 60)
         logger.info("SUMMARY")
         logger.info("=" * 60)
-        logger.info(f"Provider:          {provider}")
-        logger.info(f"Keywords:          {', '.join(keywords)}")
-        logger.info(f"Total found:       {original_count}")
-        logger.info(f"New results:       {len(new_results)}")
-        logger.info(f"Duplicates:        {duplicates_count}")
-        logger.info(f"Min threshold:     {min_results}")
-        logger.info(f"Email sent:        {'No (dry-run)' if args.dry_run else 'Yes' if len(new_results) >= min_results else 'No (below threshold)'}")
+        if args.dry_run:
+            email_status = "No (dry-run)"
+        elif len(new_results) >= min_results and args.buffer_emails:
+            email_status = "Queued (buffered)"
+        elif len(new_results) >= min_results:
+            email_status = "Yes"
+        else:
+            email_status = "No (below threshold)"
+        logger.info("Provider:          %s", provider)
+        logger.info("Keywords:          %s", ", ".join(keywords))
+        logger.info("Total found:       %d", original_count)
+        logger.info("New results:       %d", len(new_results))
+        logger.info("Duplicates:        %d", duplicates_count)
+        logger.info("Min threshold:     %d", min_results)
+        logger.info("Email sent:        %s", email_status)
         logger.info("=" * 60)
 
         return 0
@@ -355,7 +413,7 @@ def main():
         return 1
 
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=args.verbose)
+        logger.error("Error: %s", e, exc_info=args.verbose)
         return 1
 
 
@@ -0,0 +1,163 @@
+"""
+Bloom filter used as a fast negative cache in front of the seen-item store.
+
+Bits live in a bytearray and bit indices are derived by double hashing a
+128-bit BLAKE2b digest of the key, so only the standard library is required.
+"""
+
+import hashlib
+import logging
+import math
+import struct
+import threading
+from pathlib import Path
+from typing import Iterable
+
+logger = logging.getLogger(__name__)
+
+# magic, bit count, hash count, design capacity, inserted count
+_HEADER = struct.Struct("<4sQIQQ")
+_MAGIC = b"BLM1"
+
+
+class BloomFilter:
+    """
+    Probabilistic set membership with no false negatives.
+
+    A miss means the key was definitely never added; a hit means it probably
+    was and must be confirmed against the authoritative store.
+
+    Writers are serialized by a lock so concurrent adds never lose bits;
+    lookups take no lock since bits are only ever set, never cleared.
+    """
+
+    def __init__(self, num_bits: int, num_hashes: int, capacity: int = 0):
+        """
+        Initialize an empty filter.
+
+        Args:
+            num_bits: Size of the bit array
+            num_hashes: Number of bit positions set per key
+            capacity: Number of keys the filter was sized for
+        """
+        if num_bits <= 0 or num_hashes <= 0:
+            raise ValueError("num_bits and num_hashes must be positive")
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.capacity = capacity
+        self.count = 0
+        self._bits = bytearray((num_bits + 7) // 8)
+        self._set_bits = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_capacity(cls, capacity: int, error_rate: float = 1e-6) -> "BloomFilter":
+        """
+        Build a filter sized for the expected key count and false positive rate.
+
+        Uses the standard sizing m = -n·ln(p) / ln(2)², k = (m / n)·ln(2).
+
+        Args:
+            capacity: Expected number of keys
+            error_rate: Target false positive probability
+
+        Returns:
+            Empty BloomFilter
+        """
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        capacity = max(capacity, 1)
+        num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        return cls(num_bits, num_hashes, capacity)
+
+    def _indices(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        num_bits = self.num_bits
+        return [(h1 + i * h2) % num_bits for i in range(self.num_hashes)]
+
+    def add(self, key: str) -> None:
+        """Add a key to the filter."""
+        indices = self._indices(key)
+        bits = self._bits
+        with self._lock:
+            newly_set = 0
+            for index in indices:
+                byte, mask = index >> 3, 1 << (index & 7)
+                if not bits[byte] & mask:
+                    bits[byte] |= mask
+                    newly_set += 1
+            if newly_set:
+                self._set_bits += newly_set
+                self.count += 1
+
+    def add_many(self, keys: Iterable[str]) -> None:
+        """Add several keys to the filter."""
+        for key in keys:
+            self.add(key)
+
+    def popcount(self) -> int:
+        """Return the number of set bits."""
+        return self._set_bits
+
+    def estimated_error_rate(self) -> float:
+        """
+        Estimate the current false positive rate from the fill ratio.
+
+        Returns:
+            Probability that a key never added is reported as present
+        """
+        return (self._set_bits / self.num_bits) ** self.num_hashes
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[index >> 3] & (1 << (index & 7)) for index in self._indices(key))
+
+    def save(self, path: Path | str) -> None:
+        """
+        Persist the filter to disk.
+
+        Args:
+            path: Destination file path
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            header = _HEADER.pack(_MAGIC, self.num_bits, self.num_hashes, self.capacity, self.count)
+            body = bytes(self._bits)
+        with open(path, "wb") as f:
+            f.write(header)
+            f.write(body)
+
+    @classmethod
+    def load(cls, path: Path | str) -> "BloomFilter | None":
+        """
+        Load a filter previously written by save().
+
+        Args:
+            path: Source file path
+
+        Returns:
+            BloomFilter, or None if the file is missing or malformed
+        """
+        try:
+            data = Path(path).read_bytes()
+        except FileNotFoundError:
+            return None
+
+        if len(data) < _HEADER.size:
+            logger.warning(f"Bloom filter file is truncated: {path}")
+            return None
+        magic, num_bits, num_hashes, capacity, count = _HEADER.unpack_from(data)
+        body = data[_HEADER.size:]
+        if magic != _MAGIC or num_bits <= 0 or num_hashes <= 0 or len(body) != (num_bits + 7) // 8:
+            logger.warning(f"Ignoring malformed bloom filter file: {path}")
+            return None
+
+        bloom = cls(num_bits, num_hashes, capacity)
+        bloom.count = count
+        bloom._bits = bytearray(body)
+        bloom._set_bits = int.from_bytes(body, "little").bit_count()
+        return bloom
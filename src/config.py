@@ -4,16 +4,23 @@ from __future__ import annotations
 import json
 import logging
 import os
+import time
 from dataclasses import dataclass
 from typing import Any, Dict, Sequence
 
-import boto3
-from botocore.exceptions import BotoCoreError, ClientError
-
 from util import parse_keywords
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    _json_loads = json.loads
+
 LOGGER = logging.getLogger(__name__)
 
+# Parsed secrets survive warm Lambda invocations for this long before re-fetching.
+_SECRET_TTL_SECONDS = 300.0
+_SECRET_CACHE: Dict[str, tuple[float, Dict[str, Any]]] = {}
+
 
 @dataclass(slots=True)
 class ApiSecrets:
@@ -68,10 +75,16 @@ class ConfigLoader:
     """Loader that resolves environment variables and secrets once per invocation."""
 
     def __init__(self) -> None:
+        # boto3 is imported here so modules that only need the config dataclasses
+        # do not pay its import cost.
+        import boto3
+        from botocore.exceptions import BotoCoreError, ClientError
+
         self._secrets_client = boto3.client("secretsmanager")
+        self._client_errors: tuple[type[Exception], ...] = (ClientError, BotoCoreError)
 
     def load(self) -> AppConfig:
-        keywords = parse_keywords(os.environ.get("KEYWORDS", ""))
+        keywords = tuple(parse_keywords(os.environ.get("KEYWORDS", "")))
         match_mode = os.environ.get("MATCH_MODE", "OR").upper()
         if match_mode not in {"AND", "OR"}:
             raise ValueError("MATCH_MODE must be 'AND' or 'OR'")
@@ -82,7 +95,7 @@ class ConfigLoader:
         if window_hours <= 0:
             raise ValueError("WINDOW_HOURS must be positive")
         sources_raw = os.environ.get("SOURCES", "crossref,pubmed,rss")
-        sources = [part.strip().lower() for part in sources_raw.split(",") if part.strip()]
+        sources = tuple(part.strip().lower() for part in sources_raw.split(",") if part.strip())
         if not sources:
             raise ValueError("At least one source must be configured")
         app_name = os.environ.get("APP_NAME", "paper-watcher")
@@ -116,20 +129,25 @@ class ConfigLoader:
         )
 
     def _load_secret(self, secret_name: str) -> Dict[str, Any]:
+        now = time.monotonic()
+        cached = _SECRET_CACHE.get(secret_name)
+        if cached is not None and now - cached[0] < _SECRET_TTL_SECONDS:
+            return cached[1]
         try:
             response = self._secrets_client.get_secret_value(SecretId=secret_name)
-        except (ClientError, BotoCoreError) as exc:
+        except self._client_errors as exc:
             LOGGER.error("Failed to load secret %s: %s", secret_name, exc)
             raise
         secret_string = response.get("SecretString")
         if not secret_string:
             raise ValueError(f"Secret {secret_name} did not contain SecretString")
         try:
-            data = json.loads(secret_string)
-        except json.JSONDecodeError as exc:
+            data = _json_loads(secret_string)
+        except json.JSONDecodeError as exc:  # orjson.JSONDecodeError subclasses this
             raise ValueError(f"Secret {secret_name} is not valid JSON") from exc
         if not isinstance(data, dict):
             raise ValueError(f"Secret {secret_name} must be a JSON object")
+        _SECRET_CACHE[secret_name] = (now, data)
         return data
 
     def _load_ses_secret(self, secret_name: str) -> SesSecrets:
@@ -6,34 +6,59 @@ and validates all required fields.
 """
 
 import os
+import re
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Literal
 
 import yaml
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+
+try:
+    # LibYAML-backed loader; parses in C when PyYAML was built against libyaml.
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+# Comma separator together with its surrounding whitespace
+_CSV_SPLIT = re.compile(r"\s*,\s*")
+
+
+def split_csv(value: str) -> list[str]:
+    """
+    Split a comma-separated setting into trimmed items.
+
+    Args:
+        value: Raw value such as "parp, isg"
+
+    Returns:
+        List of items with surrounding whitespace removed
+    """
+    return _CSV_SPLIT.split(value.strip())
 
 
 class EmailConfig(BaseModel):
     """Email delivery configuration."""
 
     sender: str = Field(alias="from", description="Sender email address")
-    recipients: list[str] = Field(alias="to", description="List of recipient email addresses")
+    recipients: tuple[str, ...] = Field(alias="to", description="Recipient email addresses")
     subject_prefix: str = Field(description="Email subject line prefix")
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
 
 
 class PaperWatcherConfig(BaseModel):
     """Main configuration schema for Paper Watcher."""
 
-    keywords: list[str] = Field(
-        description="List of keywords to search for (case-insensitive)"
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
+
+    keywords: tuple[str, ...] = Field(
+        description="Keywords to search for (case-insensitive)"
     )
     provider: Literal["bing", "http"] = Field(
         description="Search provider: 'bing' for Bing API, 'http' for direct URL crawling"
     )
-    sources: list[str] | None = Field(
+    sources: tuple[str, ...] | None = Field(
         default=None,
         description="Source URLs (required when provider='http')"
     )
@@ -53,6 +78,12 @@ class PaperWatcherConfig(BaseModel):
     )
     email: EmailConfig = Field(description="Email configuration")
 
+    @computed_field  # type: ignore[prop-decorator]
+    @cached_property
+    def sources_set(self) -> frozenset[str]:
+        """Normalized source URLs (lowercased, trailing slash removed) for membership tests."""
+        return frozenset(source.lower().rstrip("/") for source in self.sources or ())
+
     @field_validator("sources")
     @classmethod
     def validate_sources(cls, v, values):
@@ -97,13 +128,27 @@ def load_config(config_path: str | Path = "config.yaml") -> PaperWatcherConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        config_data = yaml.safe_load(f)
+    resolved = config_path.resolve()
+    # The model is frozen and holds only tuples, so the cached instance is shared.
+    return _load_config_cached(str(resolved), resolved.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(config_path: str, mtime_ns: int) -> PaperWatcherConfig:
+    """
+    Parse and validate a config file, memoized on its path and modification time.
+
+    Editing the file changes mtime_ns, so the next load_config call re-parses it.
+    """
+    # Hand raw bytes to the loader: libyaml detects the encoding and decodes in C,
+    # skipping the Python text-layer decode and chunked reads of a text stream.
+    with open(config_path, "rb") as f:
+        config_data = yaml.load(f.read(), Loader=YamlLoader)
 
     if not config_data:
         raise ValueError(f"Configuration file is empty: {config_path}")
 
-    return PaperWatcherConfig(**config_data)
+    return PaperWatcherConfig.model_validate(config_data)
 
 
 def load_config_with_env_fallback() -> PaperWatcherConfig:
@@ -121,11 +166,11 @@ def load_config_with_env_fallback() -> PaperWatcherConfig:
 
     # Fallback to environment variables (legacy mode)
     keywords_str = os.getenv("KEYWORDS", "parp, isg, interferon, sting")
-    keywords = [k.strip() for k in keywords_str.split(",")]
+    keywords = split_csv(keywords_str)
 
     email_from = os.getenv("EMAIL_FROM", "alerts@example.com")
     email_to_str = os.getenv("EMAIL_TO", "recipient@example.com")
-    email_to = [e.strip() for e in email_to_str.split(",")]
+    email_to = split_csv(email_to_str)
 
     return PaperWatcherConfig(
         keywords=keywords,
@@ -6,31 +6,42 @@ Supports:
 - HTTP direct crawling with keyword matching
 """
 
+from importlib import import_module
+
 from .interface import ICrawler, ResultItem
 
 __all__ = ["ICrawler", "ResultItem", "BingCrawler", "HttpCrawler"]
 
 
+_LAZY_CRAWLERS = {
+    "BingCrawler": ".bing_crawler",
+    "HttpCrawler": ".http_crawler",
+}
+
+
 def __getattr__(name: str):
     """
     Lazily import optional crawler implementations.
 
-    HttpCrawler depends on optional third-party libraries (e.g. BeautifulSoup).
-    Delaying its import prevents hard failures when those extras are not
-    installed in environments that only need core interfaces (like tests).
+    Both crawlers depend on optional third-party libraries (requests,
+    BeautifulSoup). Delaying their import prevents hard failures, and the
+    import cost, in environments that only need core interfaces (like tests).
+    The resolved class is cached in the module globals so later lookups skip
+    this hook.
     """
-    if name == "BingCrawler":
-        try:
-            from .bing_crawler import BingCrawler  # pragma: no cover
-        except ModuleNotFoundError as exc:
-            missing = exc.name or "requests"
-            raise ModuleNotFoundError(
-                "BingCrawler requires optional dependency "
-                f"{missing!r}. Install it to use this crawler."
-            ) from exc
-        return BingCrawler
-    if name == "HttpCrawler":
-        from .http_crawler import HttpCrawler  # pragma: no cover
-
-        return HttpCrawler
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name = _LAZY_CRAWLERS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        module = import_module(module_name, __name__)  # pragma: no cover
+    except ModuleNotFoundError as exc:
+        missing = exc.name or "requests"
+        raise ModuleNotFoundError(
+            f"{name} requires optional dependency "
+            f"{missing!r}. Install it to use this crawler."
+        ) from exc
+
+    crawler = getattr(module, name)
+    globals()[name] = crawler
+    return crawler
@@ -5,21 +5,23 @@ Uses the Bing Web Search API v7 to find content matching keywords.
 Requires BING_API_KEY environment variable.
 """
 
+import json
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Sequence
 
 import requests
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
+from requests.adapters import HTTPAdapter
 
 from .interface import ICrawler, ResultItem
-from .utils import deduplicate_results, filter_empty_results
+from .utils import create_retry, deduplicate_results, filter_empty_results
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +36,8 @@ class BingCrawler(ICrawler):
 
     BING_API_ENDPOINT = "https://api.bing.microsoft.com/v7.0/search"
     DEFAULT_USER_AGENT = "PaperWatcher/1.0 (Bing Search Client)"
+    CONNECT_TIMEOUT = 3
+    MAX_QUERY_LENGTH = 1500
 
     def __init__(
         self,
@@ -43,6 +47,8 @@ class BingCrawler(ICrawler):
         market: str = "en-US",
         safe_search: str = "Moderate",
         timeout: int = 30,
+        keywords_per_query: int = 10,
+        max_concurrent_queries: int = 4,
     ):
         """
         Initialize Bing crawler.
@@ -53,7 +59,9 @@ class BingCrawler(ICrawler):
             count: Number of results to return per request (max 50)
             market: Market code for search (e.g., "en-US", "ko-KR")
             safe_search: SafeSearch level ("Off", "Moderate", "Strict")
-            timeout: Request timeout in seconds
+            timeout: Read timeout in seconds (connect timeout is CONNECT_TIMEOUT)
+            keywords_per_query: Maximum keywords OR-ed into a single API query
+            max_concurrent_queries: Maximum API queries in flight at once
 
         Raises:
             ValueError: If API key is not provided
@@ -70,6 +78,20 @@ class BingCrawler(ICrawler):
         self.market = market
         self.safe_search = safe_search
         self.timeout = timeout
+        self.keywords_per_query = max(1, keywords_per_query)
+        self.max_concurrent_queries = max(1, max_concurrent_queries)
+
+        # Keep-alive session so repeated queries reuse the TCP/TLS connection.
+        # Retries (honouring Retry-After on 429) run in urllib3 on that connection.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=create_retry()),
+        )
+        self._session.headers.update({
+            "Ocp-Apim-Subscription-Key": self.api_key,
+            "User-Agent": self.user_agent,
+        })
 
         logger.info(f"BingCrawler initialized (market={market}, count={count})")
 
@@ -78,7 +100,8 @@ class BingCrawler(ICrawler):
         Search Bing for content matching keywords.
 
         Args:
-            keywords: List of keywords to search for (combined with OR)
+            keywords: List of keywords to search for (combined with OR, split
+                into several concurrent queries beyond keywords_per_query)
 
         Returns:
             List of ResultItem objects
@@ -90,12 +113,33 @@ class BingCrawler(ICrawler):
         if not keywords or len(keywords) == 0:
             raise ValueError("Keywords list cannot be empty")
 
-        # Build query string: keyword1 OR keyword2 OR keyword3
-        query = " OR ".join(f'"{kw}"' for kw in keywords)
-        logger.info(f"Searching Bing with query: {query}")
+        # Build query strings: keyword1 OR keyword2 OR keyword3, one per keyword chunk
+        step = self.keywords_per_query
+        queries = [
+            self._build_query(keywords[start:start + step])
+            for start in range(0, len(keywords), step)
+        ]
+        for query in queries:
+            logger.info(f"Searching Bing with query: {query}")
+            if len(query) > self.MAX_QUERY_LENGTH:
+                logger.warning(
+                    f"Bing query is {len(query)} characters (limit {self.MAX_QUERY_LENGTH}); "
+                    "lower keywords_per_query to avoid rejected requests"
+                )
 
         try:
-            results = self._perform_search(query)
+            if len(queries) == 1:
+                results = self._perform_search(queries[0])
+            else:
+                # Chunks are independent; run them concurrently on the pooled
+                # session and merge in query order.
+                workers = min(self.max_concurrent_queries, len(queries))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    results = [
+                        item
+                        for batch in executor.map(self._perform_search, queries)
+                        for item in batch
+                    ]
             logger.info(f"Bing returned {len(results)} raw results")
 
             # Apply filters
@@ -109,15 +153,25 @@ class BingCrawler(ICrawler):
             logger.error(f"Bing search failed: {e}", exc_info=True)
             raise RuntimeError(f"Bing search failed: {e}") from e
 
-    @retry(
-        retry=retry_if_exception_type((requests.RequestException, requests.Timeout)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
+    @staticmethod
+    def _build_query(keywords: Sequence[str]) -> str:
+        """
+        Build an OR query of quoted phrases.
+
+        Double quotes inside a keyword would end its phrase early and produce a
+        malformed query, so they are replaced with spaces.
+
+        Args:
+            keywords: Keywords to combine
+
+        Returns:
+            Query string such as '"parp" OR "isg"'
+        """
+        return " OR ".join('"' + " ".join(kw.replace('"', " ").split()) + '"' for kw in keywords)
+
     def _perform_search(self, query: str) -> list[ResultItem]:
         """
-        Perform actual API request to Bing (with retry logic).
+        Perform actual API request to Bing (retried by the session adapter).
 
         Args:
             query: Search query string
@@ -125,11 +179,6 @@ class BingCrawler(ICrawler):
         Returns:
             List of ResultItem objects from API response
         """
-        headers = {
-            "Ocp-Apim-Subscription-Key": self.api_key,
-            "User-Agent": self.user_agent,
-        }
-
         params = {
             "q": query,
             "count": self.count,
@@ -142,11 +191,10 @@ class BingCrawler(ICrawler):
 
         logger.debug(f"Bing API request: {params}")
 
-        response = requests.get(
+        response = self._session.get(
             self.BING_API_ENDPOINT,
-            headers=headers,
             params=params,
-            timeout=self.timeout,
+            timeout=(self.CONNECT_TIMEOUT, self.timeout),
         )
 
         # Check for rate limiting
@@ -157,7 +205,8 @@ class BingCrawler(ICrawler):
         # Check for other errors
         response.raise_for_status()
 
-        data = response.json()
+        # Parse the raw body; skips requests' text decoding and uses orjson when installed
+        data = _json_loads(response.content)
 
         # Parse web pages from response
         web_pages = data.get("webPages", {})
@@ -181,6 +230,16 @@ class BingCrawler(ICrawler):
 
         return results
 
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self._session.close()
+
+    def __enter__(self) -> "BingCrawler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def _parse_date(self, date_str: str | None) -> datetime | None:
         """
         Parse Bing date string to datetime.
@@ -195,8 +254,9 @@ class BingCrawler(ICrawler):
             return None
 
         try:
-            # Bing returns ISO 8601 format: 2025-10-27T12:00:00.0000000Z
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except Exception as e:
+            # Bing returns ISO 8601 format: 2025-10-27T12:00:00.0000000Z.
+            # Python 3.11+ parses the trailing Z and 7-digit fractions natively.
+            return datetime.fromisoformat(date_str)
+        except (TypeError, ValueError) as e:
             logger.debug(f"Failed to parse date '{date_str}': {e}")
             return None
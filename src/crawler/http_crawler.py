@@ -7,29 +7,60 @@ on extracted text content.
 
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Sequence
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlsplit
 
 import requests
+import soupsieve
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
-from tenacity import (
-    retry,
-    retry_if_exception_type,
-    stop_after_attempt,
-    wait_exponential,
-)
 
 from .interface import ICrawler, ResultItem
-from .utils import (
-    RateLimiter,
-    RobotsTxtChecker,
-    deduplicate_results,
-    filter_empty_results,
-)
+from .utils import RateLimiter, RobotsTxtChecker, create_retry, has_text
+
+try:
+    import lxml  # noqa: F401  # C-backed tree builder for BeautifulSoup
+    HTML_PARSER = "lxml"
+except ImportError:  # pragma: no cover - optional speedup
+    HTML_PARSER = "html.parser"
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=32)
+def _keyword_pattern(keywords: tuple[str, ...]) -> re.Pattern[str]:
+    """Compile keywords into one case-insensitive alternation scanned in a single pass."""
+    # Longest first so a keyword is never shadowed by one of its prefixes
+    ordered = sorted(keywords, key=len, reverse=True)
+    return re.compile("|".join(re.escape(kw) for kw in ordered), re.IGNORECASE)
+
+
+# Characters that may be entity-encoded in markup, so raw bytes could miss them
+_MARKUP_SENSITIVE = set("&<>\"';")
+
+
+@lru_cache(maxsize=32)
+def _keyword_bytes_pattern(keywords: tuple[str, ...]) -> re.Pattern[bytes] | None:
+    """
+    Compile a raw-body prefilter that any keyword match in page text implies.
+
+    Extracted text never joins characters from different text nodes, so every
+    word of a matching keyword appears contiguously in the HTML. The pattern
+    looks for the longest word of each keyword. Returns None when a keyword
+    is non-ASCII or contains characters markup may encode, since then the
+    bytes can legitimately differ from the text.
+    """
+    tokens = []
+    for kw in keywords:
+        words = kw.split()
+        if not words or not kw.isascii() or _MARKUP_SENSITIVE.intersection(kw):
+            return None
+        tokens.append(max(words, key=len))
+    return re.compile(b"|".join(re.escape(token.encode("ascii")) for token in tokens), re.IGNORECASE)
+
+
 class HttpCrawler(ICrawler):
     """
     HTTP direct crawler for specified source URLs.
@@ -40,6 +71,22 @@ class HttpCrawler(ICrawler):
 
     DEFAULT_USER_AGENT = "PaperWatcher/1.0 (HTTP Crawler; +https://github.com/jijae92/demoSES)"
 
+    # Common article containers, combined into a single selector group and
+    # compiled once rather than per page
+    ARTICLE_SELECTOR = soupsieve.compile(", ".join([
+        "article",
+        ".article",
+        ".paper",
+        ".result-item",
+        "div[class*='article']",
+        "div[class*='paper']",
+        "li[class*='article']",
+        "li[class*='paper']",
+    ]))
+
+    # Title candidates in priority order, compiled once
+    TITLE_SELECTORS = tuple(soupsieve.compile(selector) for selector in ("h1", "h2", "h3", ".title", "a"))
+
     def __init__(
         self,
         source_urls: Sequence[str],
@@ -47,6 +94,8 @@ class HttpCrawler(ICrawler):
         timeout: int = 30,
         max_snippet_length: int = 300,
         respect_robots_txt: bool = True,
+        max_workers: int = 8,
+        max_body_bytes: int = 2_000_000,
     ):
         """
         Initialize HTTP crawler.
@@ -57,6 +106,8 @@ class HttpCrawler(ICrawler):
             timeout: Request timeout in seconds
             max_snippet_length: Maximum length for extracted snippets
             respect_robots_txt: Whether to check robots.txt before crawling
+            max_workers: Maximum number of hosts crawled concurrently
+            max_body_bytes: Maximum number of response bytes read and parsed per page
 
         Raises:
             ValueError: If source_urls is empty
@@ -64,12 +115,34 @@ class HttpCrawler(ICrawler):
         if not source_urls or len(source_urls) == 0:
             raise ValueError("source_urls cannot be empty")
 
-        self.source_urls = list(source_urls)
+        # Drop repeated sources (case and trailing slash insensitive), keeping order
+        seen_sources: set[str] = set()
+        self.source_urls = []
+        for url in source_urls:
+            key = url.lower().rstrip("/")
+            if key not in seen_sources:
+                seen_sources.add(key)
+                self.source_urls.append(url)
         self.user_agent = user_agent or self.DEFAULT_USER_AGENT
         self.timeout = timeout
         self.max_snippet_length = max_snippet_length
+        self.max_workers = max(1, max_workers)
+        self.max_body_bytes = max_body_bytes
+
+        # Keep-alive session shared by the host workers. Each host is crawled by
+        # one worker at a time, so a few pooled connections per host suffice.
+        # Retries run in urllib3 on the pooled connection.
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=4, max_retries=create_retry())
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers.update({
+            "User-Agent": self.user_agent,
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.9",
+        })
 
-        self.rate_limiter = RateLimiter(min_delay=2.0, max_delay=60.0)
+        self.rate_limiter = RateLimiter(min_delay=2.0, max_delay=60.0, capacity=3)
         self.robots_checker = RobotsTxtChecker(self.user_agent) if respect_robots_txt else None
 
         logger.info(f"HttpCrawler initialized with {len(self.source_urls)} sources")
@@ -92,93 +165,180 @@ class HttpCrawler(ICrawler):
 
         logger.info(f"Crawling {len(self.source_urls)} sources for keywords: {keywords}")
 
+        # Lowercase and dedupe once; everything downstream matches against this tuple
+        keywords = tuple(dict.fromkeys(kw.lower() for kw in keywords))
+
+        # Hosts are crawled concurrently; URLs on the same host stay sequential
+        # so the per-host rate limit and backoff still apply.
+        urls_by_host: dict[str, list[str]] = {}
+        for url in self.source_urls:
+            urls_by_host.setdefault(urlsplit(url).netloc, []).append(url)
+
+        outcomes: dict[str, tuple[str, list[ResultItem]]] = {}
+        workers = min(self.max_workers, len(urls_by_host))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._crawl_host, host, urls, keywords)
+                for host, urls in urls_by_host.items()
+            ]
+            for future in futures:
+                outcomes.update(future.result())
+
         all_results = []
+        seen_urls: set[str] = set()
         success_count = 0
         skipped_count = 0
         failed_count = 0
+        dropped_count = 0
 
+        # Merge in configured source order so output does not depend on timing.
+        # Empty and repeated results are dropped as they are merged, with the
+        # same checks as filter_empty_results/deduplicate_results.
         for url in self.source_urls:
+            status, results = outcomes.pop(url)
+            if status == "success":
+                success_count += 1
+                for item in results:
+                    url_normalized = item.url.lower().strip()
+                    if (url_normalized in seen_urls
+                            or not (has_text(item.title) and url_normalized and has_text(item.snippet))):
+                        dropped_count += 1
+                        continue
+                    seen_urls.add(url_normalized)
+                    all_results.append(item)
+            elif status == "skipped":
+                skipped_count += 1
+            else:
+                failed_count += 1
+
+        if dropped_count:
+            logger.info(f"Removed {dropped_count} empty or duplicate results")
+
+        logger.info(
+            f"Crawl complete: {success_count} success, {skipped_count} skipped, "
+            f"{failed_count} failed, {len(all_results)} unique results"
+        )
+
+        return all_results
+
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self._session.close()
+
+    def __enter__(self) -> "HttpCrawler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _crawl_host(
+        self,
+        host: str,
+        urls: Sequence[str],
+        keywords: Sequence[str],
+    ) -> dict[str, tuple[str, list[ResultItem]]]:
+        """
+        Crawl every URL of one host sequentially, honouring robots.txt and rate limits.
+
+        Args:
+            host: Hostname shared by the URLs
+            urls: URLs to crawl on this host
+            keywords: Lowercased keywords to match
+
+        Returns:
+            Mapping of URL to (status, results), where status is
+            "success", "skipped", or "failed"
+        """
+        outcomes: dict[str, tuple[str, list[ResultItem]]] = {}
+        for url in urls:
             try:
                 # Check robots.txt
                 if self.robots_checker and not self.robots_checker.is_allowed(url):
                     logger.info(f"Skipped (robots.txt): {url}")
-                    skipped_count += 1
+                    outcomes[url] = ("skipped", [])
                     continue
 
                 # Rate limiting
-                host = urlparse(url).netloc
                 self.rate_limiter.wait(host)
 
                 # Fetch and parse
                 results = self._crawl_url(url, keywords)
-                all_results.extend(results)
 
                 self.rate_limiter.record_success(host)
-                success_count += 1
+                outcomes[url] = ("success", results)
                 logger.info(f"Crawled {url}: {len(results)} matches")
 
             except Exception as e:
                 logger.warning(f"Failed to crawl {url}: {e}")
-                host = urlparse(url).netloc
                 self.rate_limiter.record_error(host)
-                failed_count += 1
-
-        # Apply filters
-        all_results = filter_empty_results(all_results)
-        all_results = deduplicate_results(all_results)
-
-        logger.info(
-            f"Crawl complete: {success_count} success, {skipped_count} skipped, "
-            f"{failed_count} failed, {len(all_results)} unique results"
-        )
+                outcomes[url] = ("failed", [])
 
-        return all_results
+        return outcomes
 
-    @retry(
-        retry=retry_if_exception_type((requests.RequestException, requests.Timeout)),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        reraise=True,
-    )
     def _crawl_url(self, url: str, keywords: Sequence[str]) -> list[ResultItem]:
         """
-        Crawl a single URL and extract matching content (with retry).
+        Crawl a single URL and extract matching content (retried by the session adapter).
 
         Args:
             url: URL to crawl
-            keywords: Keywords to match
+            keywords: Lowercased keywords to match
 
         Returns:
             List of ResultItem objects
         """
-        headers = {
-            "User-Agent": self.user_agent,
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-
         logger.debug(f"Fetching {url}")
-        response = requests.get(url, headers=headers, timeout=self.timeout)
+        response = self._session.get(url, timeout=self.timeout, stream=True)
+        try:
+            # Check for rate limiting or errors
+            if response.status_code == 429:
+                logger.warning(f"Rate limited (429): {url}")
+                raise requests.RequestException("Rate limit exceeded")
+
+            if response.status_code >= 500:
+                logger.warning(f"Server error ({response.status_code}): {url}")
+                raise requests.RequestException(f"Server error: {response.status_code}")
 
-        # Check for rate limiting or errors
-        if response.status_code == 429:
-            logger.warning(f"Rate limited (429): {url}")
-            raise requests.RequestException("Rate limit exceeded")
+            response.raise_for_status()
 
-        if response.status_code >= 500:
-            logger.warning(f"Server error ({response.status_code}): {url}")
-            raise requests.RequestException(f"Server error: {response.status_code}")
+            body = self._read_body(response, url)
+        finally:
+            response.close()
 
-        response.raise_for_status()
+        # Skip parsing pages whose raw body cannot contain any keyword
+        prefilter = _keyword_bytes_pattern(tuple(keywords))
+        if prefilter is not None and not prefilter.search(body):
+            logger.debug(f"No keywords in {url}, skipped parsing")
+            return []
 
         # Parse HTML
-        soup = BeautifulSoup(response.content, "html.parser")
+        soup = BeautifulSoup(body, HTML_PARSER)
 
         # Extract articles/items
         results = self._extract_articles(soup, url, keywords)
 
         return results
 
+    def _read_body(self, response: requests.Response, url: str) -> bytes:
+        """
+        Read a streamed response body, stopping at max_body_bytes.
+
+        Args:
+            response: Response opened with stream=True
+            url: URL being fetched (for logging)
+
+        Returns:
+            Body bytes, truncated to max_body_bytes
+        """
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self.max_body_bytes:
+                logger.debug(f"Truncated {url} at {self.max_body_bytes} bytes")
+                break
+        return b"".join(chunks)[:self.max_body_bytes]
+
     def _extract_articles(
         self,
         soup: BeautifulSoup,
@@ -191,31 +351,18 @@ class HttpCrawler(ICrawler):
         Args:
             soup: BeautifulSoup parsed HTML
             base_url: Base URL for resolving relative links
-            keywords: Keywords to match
+            keywords: Lowercased keywords to match
 
         Returns:
             List of ResultItem objects
         """
         results = []
 
-        # Try common article selectors
-        article_selectors = [
-            "article",
-            ".article",
-            ".paper",
-            ".result-item",
-            "div[class*='article']",
-            "div[class*='paper']",
-            "li[class*='article']",
-            "li[class*='paper']",
-        ]
-
-        articles = []
-        for selector in article_selectors:
-            found = soup.select(selector)
-            if found:
-                articles.extend(found)
-                logger.debug(f"Found {len(found)} elements with selector: {selector}")
+        # One pass over the document for all article selectors; matches come back
+        # once each, in document order, even when several selectors apply.
+        articles = self.ARTICLE_SELECTOR.select(soup)
+        if articles:
+            logger.debug(f"Found {len(articles)} article elements")
 
         # Fallback: if no articles found, try to extract from whole page
         if not articles:
@@ -245,7 +392,7 @@ class HttpCrawler(ICrawler):
         Args:
             element: BeautifulSoup element (article or container)
             base_url: Base URL for resolving relative links
-            keywords: Keywords to match
+            keywords: Lowercased keywords to match
 
         Returns:
             ResultItem if keywords match, None otherwise
@@ -267,8 +414,8 @@ class HttpCrawler(ICrawler):
         if not url:
             url = base_url  # Fallback to base URL
 
-        # Extract snippet
-        snippet = self._extract_snippet(element, keywords)
+        # Extract snippet, reusing the already extracted text as the fallback
+        snippet = self._extract_snippet(element, keywords, fallback_text=text_content)
 
         try:
             return ResultItem(
@@ -282,16 +429,14 @@ class HttpCrawler(ICrawler):
 
     def _matches_keywords(self, text: str, keywords: Sequence[str]) -> bool:
         """Check if text contains any of the keywords (case-insensitive)."""
-        text_lower = text.lower()
-        return any(kw.lower() in text_lower for kw in keywords)
+        # IGNORECASE matching avoids allocating a lowercased copy of the page text
+        return _keyword_pattern(tuple(keywords)).search(text) is not None
 
     def _extract_title(self, element: BeautifulSoup) -> str:
         """Extract title from article element."""
         # Try common title selectors
-        title_selectors = ["h1", "h2", "h3", ".title", "a"]
-
-        for selector in title_selectors:
-            title_elem = element.select_one(selector)
+        for selector in self.TITLE_SELECTORS:
+            title_elem = selector.select_one(element)
             if title_elem:
                 title = title_elem.get_text(strip=True)
                 if title and len(title) > 5:  # Minimum title length
@@ -310,13 +455,19 @@ class HttpCrawler(ICrawler):
 
         return base_url
 
-    def _extract_snippet(self, element: BeautifulSoup, keywords: Sequence[str]) -> str:
+    def _extract_snippet(
+        self,
+        element: BeautifulSoup,
+        keywords: Sequence[str],
+        fallback_text: str | None = None,
+    ) -> str:
         """
         Extract snippet highlighting keyword context.
 
         Args:
             element: BeautifulSoup element
-            keywords: Keywords to highlight
+            keywords: Lowercased keywords to highlight
+            fallback_text: Full element text, if the caller already extracted it
 
         Returns:
             Snippet text (truncated to max_snippet_length)
@@ -332,16 +483,22 @@ class HttpCrawler(ICrawler):
             if not text:
                 continue
 
-            # Count keyword matches
-            keyword_count = sum(1 for kw in keywords if kw.lower() in text.lower())
+            # Count each keyword separately so one nested in another
+            # (e.g. "parp" in "parp1") is still counted
+            text_lower = text.lower()
+            keyword_count = sum(kw in text_lower for kw in keywords)
 
             if keyword_count > max_keyword_count:
                 max_keyword_count = keyword_count
                 best_snippet = text
+                if keyword_count == len(keywords):
+                    break  # No later paragraph can contain more keywords
 
         # Fallback to full text
         if not best_snippet:
-            best_snippet = element.get_text(separator=" ", strip=True)
+            if fallback_text is None:
+                fallback_text = element.get_text(separator=" ", strip=True)
+            best_snippet = fallback_text
 
         # Truncate
         if len(best_snippet) > self.max_snippet_length:
@@ -5,15 +5,56 @@ Includes deduplication, robots.txt checking, rate limiting, and retry logic.
 """
 
 import logging
+import re
+import threading
 import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
 from typing import Sequence
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 from urllib.robotparser import RobotFileParser
 
+from urllib3.util.retry import Retry
+
 from .interface import ResultItem
 
 logger = logging.getLogger(__name__)
 
+# Responses worth retrying: rate limiting and transient server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)", re.IGNORECASE)
+
+
+def create_retry(total: int = 2, backoff_factor: float = 1.0, backoff_max: float = 10.0) -> Retry:
+    """
+    Build the retry policy mounted on crawler HTTP sessions.
+
+    Retries run inside urllib3 on the pooled connection, honour Retry-After on
+    429/503 (capped at backoff_max), and otherwise back off exponentially. Once retries are exhausted
+    the last response is returned rather than raised, so callers keep their
+    own status handling.
+
+    Args:
+        total: Retries after the first attempt
+        backoff_factor: Base for the exponential backoff in seconds
+        backoff_max: Upper bound for a single backoff sleep in seconds
+
+    Returns:
+        urllib3 Retry configuration
+    """
+    return Retry(
+        total=total,
+        backoff_factor=backoff_factor,
+        backoff_max=backoff_max,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+        retry_after_max=backoff_max,
+        raise_on_status=False,
+    )
+
 
 def deduplicate_results(results: Sequence[ResultItem]) -> list[ResultItem]:
     """
@@ -50,6 +91,15 @@ def deduplicate_results(results: Sequence[ResultItem]) -> list[ResultItem]:
     return deduplicated
 
 
+def has_text(value: str) -> bool:
+    """
+    Check that a string has at least one non-whitespace character.
+
+    Equivalent to bool(value.strip()) without allocating the stripped copy.
+    """
+    return bool(value) and not value.isspace()
+
+
 def filter_empty_results(results: Sequence[ResultItem]) -> list[ResultItem]:
     """
     Remove results with empty or whitespace-only fields.
@@ -60,16 +110,11 @@ def filter_empty_results(results: Sequence[ResultItem]) -> list[ResultItem]:
     Returns:
         Filtered list with valid results only
     """
-    filtered = []
-    empty_count = 0
-
-    for item in results:
-        if (item.title.strip() and
-            item.url.strip() and
-            item.snippet.strip()):
-            filtered.append(item)
-        else:
-            empty_count += 1
+    filtered = [
+        item for item in results
+        if has_text(item.title) and has_text(item.url) and has_text(item.snippet)
+    ]
+    empty_count = len(results) - len(filtered)
 
     if empty_count > 0:
         logger.warning(f"Filtered out {empty_count} empty results")
@@ -81,18 +126,40 @@ class RobotsTxtChecker:
     """
     Checks if a URL is allowed by robots.txt.
 
-    Caches robots.txt files for efficiency.
+    Caches parsed robots.txt files per host for a TTL (Cache-Control max-age
+    when the server sends one), so repeated URLs on a host are answered from
+    memory. Expired entries are revalidated with If-None-Match /
+    If-Modified-Since, and a 304 reply keeps the parsed rules without
+    downloading or parsing the file again. A failed fetch is cached as
+    "allow all" for a shorter TTL so an unreachable robots.txt is not
+    re-requested per URL.
     """
 
-    def __init__(self, user_agent: str = "PaperWatcher/1.0"):
+    def __init__(
+        self,
+        user_agent: str = "PaperWatcher/1.0",
+        ttl_seconds: float = 24 * 3600,
+        error_ttl_seconds: float = 300,
+        timeout: float = 10.0,
+    ):
         """
         Initialize the robots.txt checker.
 
         Args:
             user_agent: User-Agent string to use for checking permissions
+            ttl_seconds: How long a fetched robots.txt is reused when the
+                server does not send Cache-Control max-age
+            error_ttl_seconds: How long a failed fetch is remembered before retrying
+            timeout: Request timeout in seconds
         """
         self.user_agent = user_agent
-        self._cache: dict[str, RobotFileParser] = {}
+        self.ttl_seconds = ttl_seconds
+        self.error_ttl_seconds = error_ttl_seconds
+        self.timeout = timeout
+        # base URL -> (parser, monotonic expiry time, ETag, Last-Modified)
+        self._cache: dict[str, tuple[RobotFileParser, float, str | None, str | None]] = {}
+        # (scheme, netloc) -> base URL, so cache hits skip string building
+        self._base_urls: dict[tuple[str, str], str] = {}
         logger.debug(f"RobotsTxtChecker initialized with UA: {user_agent}")
 
     def is_allowed(self, url: str) -> bool:
@@ -109,24 +176,21 @@ class RobotsTxtChecker:
             If robots.txt cannot be fetched or parsed, defaults to True (allowed)
         """
         try:
-            parsed = urlparse(url)
-            base_url = f"{parsed.scheme}://{parsed.netloc}"
-            robots_url = f"{base_url}/robots.txt"
+            parts = urlsplit(url)
+            key = (parts.scheme, parts.netloc)
+            base_url = self._base_urls.get(key)
+            if base_url is None:
+                base_url = self._base_urls[key] = f"{parts.scheme}://{parts.netloc}"
 
             # Check cache first
-            if base_url not in self._cache:
-                logger.debug(f"Fetching robots.txt from {robots_url}")
-                rp = RobotFileParser()
-                rp.set_url(robots_url)
-                try:
-                    rp.read()
-                    self._cache[base_url] = rp
-                except Exception as e:
-                    logger.warning(f"Failed to fetch robots.txt from {robots_url}: {e}")
-                    # Default to allowed if robots.txt is unavailable
-                    return True
-
-            rp = self._cache[base_url]
+            now = time.monotonic()
+            cached = self._cache.get(base_url)
+            if cached is not None and now < cached[1]:
+                rp = cached[0]
+            else:
+                rp, ttl, etag, last_modified = self._fetch(f"{base_url}/robots.txt", cached)
+                self._cache[base_url] = (rp, now + ttl, etag, last_modified)
+
             allowed = rp.can_fetch(self.user_agent, url)
 
             if not allowed:
@@ -139,59 +203,165 @@ class RobotsTxtChecker:
             # Default to allowed on error
             return True
 
+    def _fetch(
+        self,
+        robots_url: str,
+        cached: tuple[RobotFileParser, float, str | None, str | None] | None = None,
+    ) -> tuple[RobotFileParser, float, str | None, str | None]:
+        """
+        Fetch and parse one robots.txt file, revalidating a cached copy.
+
+        Mirrors RobotFileParser.read(): 401/403 disallow everything, other
+        4xx allow everything.
+
+        Args:
+            robots_url: Absolute robots.txt URL
+            cached: Expired cache entry whose validators are sent, if any
+
+        Returns:
+            Tuple of (parser, seconds the result may be cached, ETag, Last-Modified)
+        """
+        headers = {"User-Agent": self.user_agent}
+        if cached is not None:
+            if cached[2]:
+                headers["If-None-Match"] = cached[2]
+            if cached[3]:
+                headers["If-Modified-Since"] = cached[3]
+
+        logger.debug(f"Fetching robots.txt from {robots_url}")
+        request = urllib.request.Request(robots_url, headers=headers)
+        rp = RobotFileParser(robots_url)
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                body = response.read()
+                response_headers = response.headers
+        except urllib.error.HTTPError as e:
+            if e.code == 304 and cached is not None:
+                logger.debug(f"robots.txt not modified: {robots_url}")
+                return cached[0], self._max_age(e.headers), cached[2], cached[3]
+            if e.code in (401, 403):
+                rp.disallow_all = True
+                return rp, self.ttl_seconds, None, None
+            if 400 <= e.code < 500:
+                rp.allow_all = True
+                return rp, self.ttl_seconds, None, None
+            logger.warning(f"Failed to fetch robots.txt from {robots_url}: {e}")
+            rp.allow_all = True
+            return rp, self.error_ttl_seconds, None, None
+        except Exception as e:
+            logger.warning(f"Failed to fetch robots.txt from {robots_url}: {e}")
+            # Default to allowed if robots.txt is unavailable
+            rp.allow_all = True
+            return rp, self.error_ttl_seconds, None, None
+
+        rp.parse(body.decode("utf-8", errors="replace").splitlines())
+        return (
+            rp,
+            self._max_age(response_headers),
+            response_headers.get("ETag"),
+            response_headers.get("Last-Modified"),
+        )
+
+    def _max_age(self, headers) -> float:
+        """Return the Cache-Control max-age in seconds, or the default TTL."""
+        match = _MAX_AGE_RE.search(headers.get("Cache-Control", "") if headers else "")
+        return float(match.group(1)) if match else self.ttl_seconds
+
+
+@dataclass
+class _HostState:
+    """Token bucket and error count for one host, guarded by its own lock."""
+
+    tokens: float
+    last_refill: float
+    error_count: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
 
 class RateLimiter:
     """
-    Simple rate limiter to prevent overwhelming servers.
+    Per-host token bucket rate limiter to prevent overwhelming servers.
 
-    Implements exponential backoff on errors.
+    Each host holds up to ``capacity`` tokens and regains one every
+    ``min_delay`` seconds, so short bursts go out immediately while the
+    sustained rate stays at one request per ``min_delay``. Errors halve the
+    refill rate (down to one token per ``max_delay``) until a success
+    restores it.
+
+    Safe to share between threads: each host's state has its own lock, so
+    callers only contend with others hitting the same host.
     """
 
-    def __init__(self, min_delay: float = 1.0, max_delay: float = 30.0):
+    def __init__(self, min_delay: float = 1.0, max_delay: float = 30.0, capacity: int = 1):
         """
         Initialize rate limiter.
 
         Args:
-            min_delay: Minimum delay between requests in seconds
-            max_delay: Maximum delay for exponential backoff in seconds
+            min_delay: Seconds to refill one token, i.e. the sustained delay between requests
+            max_delay: Maximum refill interval after repeated errors in seconds
+            capacity: Number of requests a host may burst without waiting
         """
         self.min_delay = min_delay
         self.max_delay = max_delay
-        self._last_request_time: dict[str, float] = {}
-        self._error_count: dict[str, int] = {}
+        self.capacity = capacity
+        self._hosts: dict[str, _HostState] = {}
+        # Only guards inserting new hosts into _hosts
+        self._hosts_lock = threading.Lock()
+
+    def _state(self, host: str) -> _HostState:
+        """Return the state for host, creating a full bucket on first use."""
+        state = self._hosts.get(host)
+        if state is None:
+            with self._hosts_lock:
+                state = self._hosts.setdefault(
+                    host, _HostState(float(self.capacity), time.monotonic())
+                )
+        return state
 
     def wait(self, host: str) -> None:
         """
-        Wait appropriate amount of time before making a request to host.
+        Take a token for host, sleeping until one is available.
 
         Args:
             host: Hostname to rate limit
         """
-        current_time = time.time()
-
-        if host in self._last_request_time:
-            elapsed = current_time - self._last_request_time[host]
-            delay = self._calculate_delay(host)
-
-            if elapsed < delay:
-                sleep_time = delay - elapsed
-                logger.debug(f"Rate limiting {host}: sleeping {sleep_time:.2f}s")
-                time.sleep(sleep_time)
-
-        self._last_request_time[host] = time.time()
-
-    def _calculate_delay(self, host: str) -> float:
-        """Calculate delay based on error count (exponential backoff)."""
-        error_count = self._error_count.get(host, 0)
+        state = self._state(host)
+        # Held while sleeping so concurrent callers for this host queue up
+        with state.lock:
+            interval = self._calculate_delay(state.error_count)
+            if interval <= 0:
+                return
+
+            now = time.monotonic()
+            tokens = min(float(self.capacity), state.tokens + (now - state.last_refill) / interval)
+
+            if tokens >= 1:
+                state.tokens = tokens - 1
+                state.last_refill = now
+                return
+
+            sleep_time = (1 - tokens) * interval
+            logger.debug(f"Rate limiting {host}: sleeping {sleep_time:.2f}s")
+            time.sleep(sleep_time)
+            state.tokens = 0.0
+            state.last_refill = now + sleep_time
+
+    def _calculate_delay(self, error_count: int) -> float:
+        """Calculate the refill interval based on error count (multiplicative decrease)."""
         delay = self.min_delay * (2 ** error_count)
         return min(delay, self.max_delay)
 
     def record_error(self, host: str) -> None:
         """Record an error for exponential backoff."""
-        self._error_count[host] = self._error_count.get(host, 0) + 1
-        logger.warning(f"Error count for {host}: {self._error_count[host]}")
+        state = self._state(host)
+        with state.lock:
+            state.error_count += 1
+            error_count = state.error_count
+        logger.warning(f"Error count for {host}: {error_count}")
 
     def record_success(self, host: str) -> None:
         """Record a successful request (resets error count)."""
-        if host in self._error_count:
-            del self._error_count[host]
+        state = self._hosts.get(host)
+        if state is not None and state.error_count:
+            with state.lock:
+                state.error_count = 0
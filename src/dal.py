@@ -2,30 +2,71 @@
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass, field
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import InitVar, dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Sequence
+from typing import Any, Iterable, Sequence
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
 from util import PaperItem
 
 LOGGER = logging.getLogger(__name__)
 
+_BATCH_GET_LIMIT = 100
+_BATCH_WRITE_LIMIT = 25
+_MAX_WRITE_WORKERS = 8
+# Upper bound on paper IDs remembered as seen between warm invocations.
+_SEEN_CACHE_LIMIT = 50_000
+# Retries for keys/items DynamoDB returns as unprocessed when throttled.
+_UNPROCESSED_MAX_RETRIES = 5
+_UNPROCESSED_BASE_DELAY_SECONDS = 0.05
+_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    tcp_keepalive=True,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    # Requests are built by this module in a fixed shape; skip botocore's
+    # per-call Python walk of the input shape. DynamoDB still validates.
+    parameter_validation=False,
+)
+_shared_client: Any = None
+
+
+def _default_client() -> Any:
+    """Return a DynamoDB client shared across repositories and warm invocations."""
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = boto3.client("dynamodb", config=_CLIENT_CONFIG)
+    return _shared_client
+
 
 @dataclass(slots=True)
 class SeenRepository:
     """Repository abstraction for the DynamoDB table."""
 
     table_name: str
+    client: InitVar[Any] = None
     _client: Any = field(init=False, repr=False)
+    # IDs known to be in the table. Only positives are cached: an item never
+    # leaves the table, but another run may add one we last saw as missing.
+    _seen_cache: set[str] = field(init=False, repr=False, default_factory=set)
 
-    def __post_init__(self) -> None:
-        self._client = boto3.client("dynamodb")
+    def __post_init__(self, client: Any) -> None:
+        self._client = client if client is not None else _default_client()
+
+    def _remember_seen(self, paper_ids: Iterable[str]) -> None:
+        if len(self._seen_cache) >= _SEEN_CACHE_LIMIT:
+            self._seen_cache.clear()
+        self._seen_cache.update(paper_ids)
 
     def is_seen(self, paper_id: str) -> bool:
         """Return True if the paper has already been observed."""
+        if paper_id in self._seen_cache:
+            return True
         try:
             response = self._client.get_item(
                 TableName=self.table_name,
@@ -36,13 +77,61 @@ class SeenRepository:
         except (ClientError, BotoCoreError):
             LOGGER.exception("DynamoDB get_item failed for %s", paper_id)
             raise
-        return "Item" in response
+        if "Item" not in response:
+            return False
+        self._remember_seen((paper_id,))
+        return True
+
+    def which_seen(self, paper_ids: Sequence[str]) -> set[str]:
+        """Return the subset of paper_ids already observed using batch_get_item."""
+        cache = self._seen_cache
+        seen = {paper_id for paper_id in paper_ids if paper_id in cache}
+        # BatchGetItem rejects requests that repeat a key.
+        unique_ids = [paper_id for paper_id in dict.fromkeys(paper_ids) if paper_id not in seen]
+        if not unique_ids:
+            return seen
+        cached_count = len(seen)
+        for start in range(0, len(unique_ids), _BATCH_GET_LIMIT):
+            chunk = unique_ids[start : start + _BATCH_GET_LIMIT]
+            request: dict[str, Any] = {
+                self.table_name: {
+                    "Keys": [{"paper_id": {"S": paper_id}} for paper_id in chunk],
+                    "ProjectionExpression": "paper_id",
+                    "ConsistentRead": False,
+                }
+            }
+            retries = 0
+            while request:
+                try:
+                    response = self._client.batch_get_item(RequestItems=request)
+                except (ClientError, BotoCoreError):
+                    LOGGER.exception("DynamoDB batch_get_item failed")
+                    raise
+                for record in response.get("Responses", {}).get(self.table_name, []):
+                    seen.add(record["paper_id"]["S"])
+                request = response.get("UnprocessedKeys") or {}
+                if not request:
+                    break
+                if retries >= _UNPROCESSED_MAX_RETRIES:
+                    LOGGER.warning(
+                        "DynamoDB left %d keys unprocessed after %d retries; treating them as unseen",
+                        len(request.get(self.table_name, {}).get("Keys", [])),
+                        retries,
+                    )
+                    break
+                time.sleep(_UNPROCESSED_BASE_DELAY_SECONDS * (2**retries))
+                retries += 1
+        if len(seen) > cached_count:
+            self._remember_seen(seen)
+        return seen
 
     def mark_seen(self, items: Sequence[PaperItem]) -> None:
         """Persist the provided items as seen using batch_write_item."""
         if not items:
             return
-        now_iso = datetime.now(timezone.utc).isoformat()
+        # Every item shares one timestamp, so share its attribute value too;
+        # boto3 only reads the request while serializing it.
+        created_at = {"S": datetime.now(timezone.utc).isoformat()}
         requests = [
             {
                 "PutRequest": {
@@ -50,19 +139,51 @@ class SeenRepository:
                         "paper_id": {"S": item.paper_id},
                         "source": {"S": item.source},
                         "title": {"S": item.title[:400]},
-                        "created_at": {"S": now_iso},
+                        "created_at": created_at,
                     }
                 }
             }
             for item in items
         ]
-        chunks = [requests[i : i + 25] for i in range(0, len(requests), 25)]
-        for chunk in chunks:
+        chunks = [
+            requests[i : i + _BATCH_WRITE_LIMIT] for i in range(0, len(requests), _BATCH_WRITE_LIMIT)
+        ]
+        if len(chunks) == 1:
+            unwritten = self._write_chunk(chunks[0])
+        else:
+            # The client is thread-safe; overlap the per-chunk round-trips.
+            with ThreadPoolExecutor(max_workers=min(_MAX_WRITE_WORKERS, len(chunks))) as executor:
+                unwritten = [
+                    request for failed in executor.map(self._write_chunk, chunks) for request in failed
+                ]
+        # Only cache IDs DynamoDB actually stored, so unwritten ones are
+        # probed (and written) again by later runs.
+        unwritten_ids = {request["PutRequest"]["Item"]["paper_id"]["S"] for request in unwritten}
+        self._remember_seen(
+            item.paper_id for item in items if item.paper_id not in unwritten_ids
+        )
+
+    def _write_chunk(self, chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Write one batch, retrying UnprocessedItems with backoff and jitter.
+
+        Returns the write requests still unprocessed when retries ran out.
+        """
+        request: dict[str, Any] = {self.table_name: chunk}
+        retries = 0
+        while True:
             try:
-                response = self._client.batch_write_item(RequestItems={self.table_name: chunk})
+                response = self._client.batch_write_item(RequestItems=request)
             except (ClientError, BotoCoreError):
                 LOGGER.exception("DynamoDB batch_write_item failed")
                 raise
-            unprocessed = response.get("UnprocessedItems", {})
-            if unprocessed:
-                LOGGER.warning("Some DynamoDB items were unprocessed: %s", unprocessed)
\ No newline at end of file
+            request = response.get("UnprocessedItems") or {}
+            if not request:
+                return []
+            if retries >= _UNPROCESSED_MAX_RETRIES:
+                LOGGER.warning("Some DynamoDB items were unprocessed: %s", request)
+                return request.get(self.table_name, [])
+            time.sleep(
+                _UNPROCESSED_BASE_DELAY_SECONDS * (2**retries)
+                + random.uniform(0, _UNPROCESSED_BASE_DELAY_SECONDS)
+            )
+            retries += 1
@@ -4,19 +4,25 @@ Email delivery module for Paper Watcher.
 Supports AWS SES (preferred) and SMTP fallback.
 """
 
+import html
+import json
 import logging
 import os
 import smtplib
-from datetime import datetime
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any
+from pathlib import Path
+from typing import Any, Iterator
 
 try:
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError, NoCredentialsError
 except ImportError:  # pragma: no cover - exercised via tests
     boto3 = None  # type: ignore[assignment]
+    Config = None  # type: ignore[assignment,misc]
     ClientError = NoCredentialsError = Exception  # type: ignore[assignment]
 
 # Optional toggle that tests (and callers) can override.
@@ -26,6 +32,28 @@ from src.crawler.interface import ResultItem
 
 logger = logging.getLogger(__name__)
 
+# Disk-backed queue used by BufferedEmailer
+DEFAULT_PENDING_PATH = Path(".data/pending_email.jsonl")
+DEFAULT_FLUSH_DELAY_SECONDS = 300
+
+# Snippet characters shown per result; str slicing returns the same object
+# when the snippet is already this short, so no copy is made in that case.
+SNIPPET_PREVIEW_CHARS = 300
+
+# One results-table row of the HTML email, filled with %% formatting:
+# (index, url, title, snippet, published)
+_ROW_TEMPLATE = """
+        <tr>
+            <td style="padding: 12px; border-bottom: 1px solid #e0e0e0; text-align: center;">%d</td>
+            <td style="padding: 12px; border-bottom: 1px solid #e0e0e0;">
+                <strong><a href="%s" style="color: #1a73e8; text-decoration: none;">%s</a></strong>
+                <br>
+                <span style="color: #5f6368; font-size: 14px;">%s...</span>
+                %s
+            </td>
+        </tr>
+        """
+
 
 class EmailStats:
     """Statistics for email generation."""
@@ -74,24 +102,28 @@ def generate_html_email(
         stats.total_found = len(results)
         stats.total_new = len(results)
 
+    keywords_str = html.escape(', '.join(keywords))
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M UTC')
+
     # Build results table
-    results_html = ""
+    parts: list[str] = []
+    append = parts.append
+    escape = html.escape
     for i, item in enumerate(results, 1):
         published_str = ""
         if item.published_at:
-            published_str = f"<br><small>Published: {item.published_at.strftime('%Y-%m-%d %H:%M UTC')}</small>"
-
-        results_html += f"""
-        <tr>
-            <td style="padding: 12px; border-bottom: 1px solid #e0e0e0; text-align: center;">{i}</td>
-            <td style="padding: 12px; border-bottom: 1px solid #e0e0e0;">
-                <strong><a href="{item.url}" style="color: #1a73e8; text-decoration: none;">{item.title}</a></strong>
-                <br>
-                <span style="color: #5f6368; font-size: 14px;">{item.snippet[:300]}...</span>
-                {published_str}
-            </td>
-        </tr>
-        """
+            # isoformat is much cheaper than strftime; [:16] drops any UTC offset
+            published = item.published_at.isoformat(sep=' ', timespec='minutes')[:16]
+            published_str = f"<br><small>Published: {published} UTC</small>"
+
+        append(_ROW_TEMPLATE % (
+            i,
+            escape(item.url),
+            escape(item.title),
+            escape(item.snippet[:SNIPPET_PREVIEW_CHARS]),
+            published_str,
+        ))
+    results_html = "".join(parts)
 
     # Build stats summary
     stats_html = f"""
@@ -115,7 +147,7 @@ def generate_html_email(
     """
 
     # Complete HTML template
-    html = f"""
+    body = f"""
 <!DOCTYPE html>
 <html>
 <head>
@@ -132,10 +164,10 @@ def generate_html_email(
         <div style="background-color: white; padding: 30px; border: 1px solid #e0e0e0; border-top: none;">
             <div style="margin-bottom: 20px;">
                 <p style="font-size: 14px; color: #5f6368; margin: 5px 0;">
-                    <strong>Keywords:</strong> {', '.join(keywords)}
+                    <strong>Keywords:</strong> {keywords_str}
                 </p>
                 <p style="font-size: 14px; color: #5f6368; margin: 5px 0;">
-                    <strong>Date:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M UTC')}
+                    <strong>Date:</strong> {now_str}
                 </p>
             </div>
 
@@ -166,7 +198,7 @@ def generate_html_email(
 </html>
     """
 
-    return html.strip()
+    return body.strip()
 
 
 def generate_subject(
@@ -260,6 +292,7 @@ class Emailer:
         self.smtp_user = smtp_user or os.getenv("SMTP_USER")
         self.smtp_password = smtp_password or os.getenv("SMTP_PASSWORD")
         self.use_tls = use_tls
+        self._ses: Any = None
 
         logger.info(f"Emailer initialized: {sender} -> {len(recipients)} recipients")
 
@@ -313,6 +346,17 @@ class Emailer:
             logger.error("No email delivery method available (SES failed, SMTP not configured)")
             return False
 
+    @property
+    def ses_client(self) -> Any:
+        """SES client created on first use and reused for later sends."""
+        if self._ses is None:
+            self._ses = boto3.client(
+                'ses',
+                region_name=self.aws_region,
+                config=Config(retries={'max_attempts': 5, 'mode': 'adaptive'}, max_pool_connections=10),
+            )
+        return self._ses
+
     def _send_via_ses(self, subject: str, html_body: str) -> bool:
         """
         Send email via AWS SES.
@@ -332,7 +376,7 @@ class Emailer:
 
         logger.debug(f"Sending via SES (region: {self.aws_region})")
 
-        ses_client = boto3.client('ses', region_name=self.aws_region)
+        ses_client = self.ses_client
 
         try:
             response = ses_client.send_email(
@@ -433,3 +477,181 @@ class Emailer:
         if isinstance(BOTO3_AVAILABLE, bool):
             return BOTO3_AVAILABLE
         return True
+
+
+def _result_to_record(item: ResultItem) -> dict[str, Any]:
+    return {
+        "title": item.title,
+        "url": item.url,
+        "snippet": item.snippet,
+        "published_at": item.published_at.isoformat() if item.published_at else None,
+    }
+
+
+def _result_from_record(record: dict[str, Any]) -> ResultItem:
+    published_at = record.get("published_at")
+    return ResultItem(
+        title=record["title"],
+        url=record["url"],
+        snippet=record["snippet"],
+        published_at=datetime.fromisoformat(published_at) if published_at else None,
+    )
+
+
+class BufferedEmailer:
+    """
+    Queue notifications on disk and deliver them as one digest per flush window.
+
+    Each send_email call appends a JSON line to the pending queue instead of
+    calling SES. flush() merges every entry whose window has elapsed into a
+    single email through the wrapped Emailer, so bursty runs cost one
+    SendEmail call per window rather than one per run.
+
+    Queueing and flushing hold an exclusive flock on a sidecar lock file, so
+    entries appended while a flush is sending are not overwritten when the
+    flush rewrites the queue.
+    """
+
+    def __init__(
+        self,
+        emailer: Emailer,
+        pending_path: Path | str = DEFAULT_PENDING_PATH,
+        flush_delay_seconds: int = DEFAULT_FLUSH_DELAY_SECONDS,
+    ):
+        """
+        Initialize buffered emailer.
+
+        Args:
+            emailer: Emailer used to deliver digests
+            pending_path: Path to the JSON Lines queue file
+            flush_delay_seconds: Seconds an entry waits before it is due
+        """
+        self.emailer = emailer
+        self.pending_path = Path(pending_path)
+        self.flush_delay = timedelta(seconds=flush_delay_seconds)
+        self.lock_path = self.pending_path.with_suffix(self.pending_path.suffix + ".lock")
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold an exclusive lock on the pending queue across processes."""
+        # POSIX-only; imported here so the module loads without buffering.
+        import fcntl
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def send_email(
+        self,
+        results: list[ResultItem],
+        keywords: list[str],
+        stats: EmailStats | None = None,
+        min_results: int = 1,
+    ) -> bool:
+        """
+        Queue results for the next digest.
+
+        Args:
+            results: List of ResultItem objects
+            keywords: Keywords that were searched
+            stats: Optional execution statistics
+            min_results: Minimum number of results required to queue
+
+        Returns:
+            True if the results were queued, False if below min_results
+        """
+        if len(results) < min_results:
+            logger.info(
+                f"Skipping email: {len(results)} results < min_results ({min_results})"
+            )
+            return False
+
+        entry = {
+            "flush_after": (datetime.now(timezone.utc) + self.flush_delay).isoformat(),
+            "keywords": list(keywords),
+            "stats": stats.to_dict() if stats else None,
+            "results": [_result_to_record(item) for item in results],
+        }
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._locked(), open(self.pending_path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+        logger.info(f"Queued {len(results)} results for digest ({self.pending_path})")
+        return True
+
+    def _read_pending(self) -> list[dict[str, Any]]:
+        if not self.pending_path.exists():
+            return []
+        entries = []
+        with open(self.pending_path, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping malformed pending email entry at line {line_number}")
+        return entries
+
+    def _write_pending(self, entries: list[dict[str, Any]]) -> None:
+        if not entries:
+            self.pending_path.unlink(missing_ok=True)
+            return
+        tmp_path = self.pending_path.with_suffix(self.pending_path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(entry, ensure_ascii=False) + "\n" for entry in entries)
+        os.replace(tmp_path, self.pending_path)
+
+    def flush(self, force: bool = False) -> int:
+        """
+        Send one digest containing every due entry in the queue.
+
+        Args:
+            force: Send all queued entries regardless of their flush window
+
+        Returns:
+            Number of results delivered (0 if nothing was due or delivery failed)
+        """
+        # Held through delivery so entries queued meanwhile wait instead of
+        # being lost when the queue is rewritten below.
+        with self._locked():
+            return self._flush_due(force)
+
+    def _flush_due(self, force: bool) -> int:
+        entries = self._read_pending()
+        now = datetime.now(timezone.utc)
+        due, remaining = [], []
+        for entry in entries:
+            is_due = force or datetime.fromisoformat(entry["flush_after"]) <= now
+            (due if is_due else remaining).append(entry)
+
+        if not due:
+            logger.info(f"No pending email entries due ({len(remaining)} waiting)")
+            return 0
+
+        keywords: dict[str, None] = {}
+        results_by_url: dict[str, ResultItem] = {}
+        stats = EmailStats()
+        for entry in due:
+            keywords.update(dict.fromkeys(entry.get("keywords", [])))
+            for record in entry.get("results", []):
+                results_by_url.setdefault(record["url"], _result_from_record(record))
+            for key, value in (entry.get("stats") or {}).items():
+                setattr(stats, key, getattr(stats, key, 0) + value)
+
+        results = list(results_by_url.values())
+        stats.total_new = len(results)
+        if not stats.total_found:
+            stats.total_found = len(results)
+
+        logger.info(f"Flushing {len(due)} queued notifications as one digest ({len(results)} results)")
+        if not self.emailer.send_email(results, list(keywords), stats, min_results=1):
+            logger.warning("Digest delivery failed; entries kept for the next flush")
+            return 0
+
+        self._write_pending(remaining)
+        return len(results)
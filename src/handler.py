@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import replace
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Mapping, Sequence
@@ -22,6 +23,10 @@ from util import PaperItem, utcnow
 LOGGER = logging.getLogger()
 LOGGER.setLevel(logging.INFO)
 
+_repository: SeenRepository | None = None
+# Fetches are I/O bound; cap threads in case runtime sources grow or repeat.
+_MAX_FETCH_WORKERS = 8
+
 
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """Lambda entry point expected by AWS."""
@@ -95,7 +100,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         LOGGER.info("No items matched keyword filters")
         return {"status": "no_matches"}
 
-    repository = SeenRepository(config.ddb_table)
+    repository = _get_repository(config.ddb_table)
     new_items = _filter_seen_items(repository, filtered_items)
     new_counts = {source: len(items) for source, items in new_items.items()}
     new_total = sum(new_counts.values())
@@ -146,6 +151,14 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     return {"status": "ok", "new_items": len(flat_items)}
 
 
+def _get_repository(table_name: str) -> SeenRepository:
+    """Return a repository that is reused across warm invocations."""
+    global _repository
+    if _repository is None or _repository.table_name != table_name:
+        _repository = SeenRepository(table_name)
+    return _repository
+
+
 def _fetch_sources(
     config: AppConfig,
     runtime: RuntimeOptions,
@@ -154,56 +167,80 @@ def _fetch_sources(
 ) -> tuple[Dict[str, List[PaperItem]], Dict[str, int]]:
     results: Dict[str, List[PaperItem]] = {}
     counts: Dict[str, int] = {}
-    for source in runtime.sources:
-        try:
-            if source == "pubmed":
-                items = fetch_pubmed(
-                    keywords=runtime.keywords,
-                    match_mode=runtime.match_mode,
-                    window_start_dt=window_start_dt,
-                    window_end_dt=window_end_dt,
-                    user_agent=config.user_agent,
-                    api_key=config.api_secrets.pubmed_api_key,
-                )
-            elif source == "rss":
-                items = fetch_rss(
-                    keywords=runtime.keywords,
-                    match_mode=runtime.match_mode,
-                    window_start_dt=window_start_dt,
-                    window_end_dt=window_end_dt,
-                    user_agent=config.user_agent,
-                )
-            elif source == "crossref":
-                items = fetch_crossref(
-                    keywords=runtime.keywords,
-                    match_mode=runtime.match_mode,
-                    window_start_dt=window_start_dt,
-                    window_end_dt=window_end_dt,
-                    user_agent=config.user_agent,
-                    contact_email=config.api_secrets.user_agent_email,
-                )
-            else:
-                LOGGER.warning("Unsupported source requested: %s", source)
+    if not runtime.sources:
+        return results, counts
+    with ThreadPoolExecutor(max_workers=min(_MAX_FETCH_WORKERS, len(runtime.sources))) as executor:
+        futures = [
+            (
+                source,
+                executor.submit(
+                    _fetch_source, source, config, runtime, window_start_dt, window_end_dt
+                ),
+            )
+            for source in runtime.sources
+        ]
+        # Collect in request order so summaries stay deterministic; the fetches
+        # themselves still overlap.
+        for source, future in futures:
+            try:
+                items = future.result()
+            except Exception:  # noqa: BLE001
+                LOGGER.exception("Failed to fetch items from %s", source)
                 continue
-        except Exception:  # noqa: BLE001
-            LOGGER.exception("Failed to fetch items from %s", source)
-            continue
-        counts[source] = len(items)
-        results[source] = items
+            if items is None:
+                continue
+            counts[source] = len(items)
+            results[source] = items
     return results, counts
 
 
+def _fetch_source(
+    source: str,
+    config: AppConfig,
+    runtime: RuntimeOptions,
+    window_start_dt: datetime,
+    window_end_dt: datetime,
+) -> List[PaperItem] | None:
+    if source == "pubmed":
+        return fetch_pubmed(
+            keywords=runtime.keywords,
+            match_mode=runtime.match_mode,
+            window_start_dt=window_start_dt,
+            window_end_dt=window_end_dt,
+            user_agent=config.user_agent,
+            api_key=config.api_secrets.pubmed_api_key,
+        )
+    if source == "rss":
+        return fetch_rss(
+            keywords=runtime.keywords,
+            match_mode=runtime.match_mode,
+            window_start_dt=window_start_dt,
+            window_end_dt=window_end_dt,
+            user_agent=config.user_agent,
+        )
+    if source == "crossref":
+        return fetch_crossref(
+            keywords=runtime.keywords,
+            match_mode=runtime.match_mode,
+            window_start_dt=window_start_dt,
+            window_end_dt=window_end_dt,
+            user_agent=config.user_agent,
+            contact_email=config.api_secrets.user_agent_email,
+        )
+    LOGGER.warning("Unsupported source requested: %s", source)
+    return None
+
+
 def _filter_seen_items(
     repository: SeenRepository,
     items_by_source: Mapping[str, Sequence[PaperItem]],
 ) -> Dict[str, List[PaperItem]]:
+    seen_ids = repository.which_seen(
+        [item.paper_id for items in items_by_source.values() for item in items]
+    )
     new_items: Dict[str, List[PaperItem]] = {}
     for source, items in items_by_source.items():
-        unseen: List[PaperItem] = []
-        for item in items:
-            if repository.is_seen(item.paper_id):
-                continue
-            unseen.append(item)
+        unseen = [item for item in items if item.paper_id not in seen_ids]
         if unseen:
             new_items[source] = unseen
     return new_items
@@ -225,7 +262,12 @@ def _build_summary(
         "fetch_counts": dict(fetch_counts),
         "filtered_counts": dict(filtered_counts),
         "new_counts": dict(new_counts),
-        "filter_stats": filter_stats.as_dict(post_seen=post_seen),
+        "filter_stats": {
+            "post_fetch": filter_stats.post_fetch,
+            "post_keyword": filter_stats.post_keyword,
+            "post_dedup": filter_stats.post_dedup,
+            "post_seen": post_seen,
+        },
     }
 
 
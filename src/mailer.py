@@ -4,11 +4,15 @@ from __future__ import annotations
 import logging
 import smtplib
 import ssl
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from email.message import EmailMessage
-from typing import Dict, Mapping, Sequence, TYPE_CHECKING
+from functools import lru_cache
+from typing import Dict, Iterator, Mapping, Sequence, Tuple, TYPE_CHECKING
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import BotoCoreError, ClientError
 
 from config import AppConfig
@@ -18,6 +22,24 @@ if TYPE_CHECKING:  # pragma: no cover
     from runtime import RuntimeOptions
 
 LOGGER = logging.getLogger(__name__)
+
+_SES_MAX_RECIPIENTS = 50
+_SES_MAX_WORKERS = 10
+
+# Logged-in SMTP connections kept across sends and warm invocations, keyed by
+# (host, port, user), with the number of messages each has sent. Connections
+# are recycled after a fixed number of messages to stay within provider limits.
+_SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+_SMTP_POOL: Dict[Tuple[str, int, str], Tuple[smtplib.SMTP, int]] = {}
+_SMTP_LOCK = threading.Lock()
+
+_SES_CLIENT_CONFIG = Config(
+    connect_timeout=2,
+    read_timeout=5,
+    retries={"max_attempts": 2, "mode": "standard"},
+    # Room for concurrent sends sharing one client without discarding connections.
+    max_pool_connections=50,
+)
 
 
 class EmailDeliveryError(Exception):
@@ -30,46 +52,53 @@ def _render_body(
     window_start: datetime,
     window_end: datetime,
 ) -> str:
+    return "\n".join(_body_lines(items_by_source, summary, window_start, window_end))
+
+
+def _body_lines(
+    items_by_source: Mapping[str, Sequence[PaperItem]],
+    summary: Mapping[str, object],
+    window_start: datetime,
+    window_end: datetime,
+) -> Iterator[str]:
     total = sum(len(items) for items in items_by_source.values())
-    lines = [
-        f"검색 기간: {window_start.isoformat()} ~ {window_end.isoformat()}",
-        f"검색 소스: {', '.join(summary.get('sources', []))}",
-        f"매치 모드: {summary.get('match_mode')} | 키워드 {len(summary.get('keywords', []))}개",
-        "키워드 매칭 기준: title/abstract contains",
-        "",
-    ]
+    yield f"검색 기간: {window_start.isoformat()} ~ {window_end.isoformat()}"
+    yield f"검색 소스: {', '.join(summary.get('sources', []))}"
+    yield f"매치 모드: {summary.get('match_mode')} | 키워드 {len(summary.get('keywords', []))}개"
+    yield "키워드 매칭 기준: title/abstract contains"
+    yield ""
     if total:
-        lines.append(f"총 {total}건의 신규 논문을 발견했습니다.")
+        yield f"총 {total}건의 신규 논문을 발견했습니다."
     else:
-        lines.append("조건에 일치하는 신규 논문이 없었습니다. 아래는 요약 정보입니다.")
+        yield "조건에 일치하는 신규 논문이 없었습니다. 아래는 요약 정보입니다."
     for source, items in items_by_source.items():
         if not items:
             continue
-        lines.append("")
-        lines.append(f"[{source.upper()}] {len(items)}건")
+        yield ""
+        yield f"[{source.upper()}] {len(items)}건"
         for item in items:
-            lines.append(f"- {item.title}")
-            lines.append(f"  저자: {summarize_authors(item.authors)}")
+            yield f"- {item.title}"
+            yield f"  저자: {summarize_authors(item.authors)}"
             if item.journal:
-                lines.append(f"  저널: {item.journal}")
+                yield f"  저널: {item.journal}"
             if item.published:
-                lines.append(f"  발행일: {item.published_iso()}")
+                yield f"  발행일: {item.published_iso()}"
             if item.matched_keywords:
-                lines.append(f"  일치 키워드: {', '.join(item.matched_keywords)}")
-            lines.append(f"  링크: {item.url}")
+                yield f"  일치 키워드: {', '.join(item.matched_keywords)}"
+            yield f"  링크: {item.url}"
             if item.summary:
-                lines.append(f"  요약: {item.summary}")
-    lines.append("")
+                yield f"  요약: {item.summary}"
+    yield ""
     filter_stats = summary.get("filter_stats", {})
-    lines.append("[처리 요약]")
+    yield "[처리 요약]"
     fetch_counts_line = ", ".join(
         f"{src}={cnt}" for src, cnt in summary.get("fetch_counts", {}).items()
     )
-    lines.append(f"- Fetch counts: {fetch_counts_line}" if fetch_counts_line else "- Fetch counts: 없음")
+    yield f"- Fetch counts: {fetch_counts_line}" if fetch_counts_line else "- Fetch counts: 없음"
     filtered_counts_line = ", ".join(
         f"{src}={cnt}" for src, cnt in summary.get("filtered_counts", {}).items()
     )
-    lines.append(
+    yield (
         f"- Filtered counts: {filtered_counts_line}"
         if filtered_counts_line
         else "- Filtered counts: 없음"
@@ -77,18 +106,15 @@ def _render_body(
     new_counts_line = ", ".join(
         f"{src}={cnt}" for src, cnt in summary.get("new_counts", {}).items()
     )
-    lines.append(
-        f"- New counts: {new_counts_line}" if new_counts_line else "- New counts: 없음"
-    )
-    lines.append(
+    yield f"- New counts: {new_counts_line}" if new_counts_line else "- New counts: 없음"
+    yield (
         "- Filter stats: post_fetch={post_fetch} post_keyword={post_keyword} post_dedup={post_dedup} post_seen={post_seen}".format(
-            post_fetch=filter_stats.get("post_fetch", filter_stats.get("total", 0)),
-            post_keyword=filter_stats.get("post_keyword", filter_stats.get("matched", 0)),
-            post_dedup=filter_stats.get("post_dedup", filter_stats.get("unique", 0)),
+            post_fetch=filter_stats.get("post_fetch", 0),
+            post_keyword=filter_stats.get("post_keyword", 0),
+            post_dedup=filter_stats.get("post_dedup", 0),
             post_seen=filter_stats.get("post_seen", 0),
         )
     )
-    return "\n".join(lines)
 
 
 def _build_message(
@@ -147,21 +173,42 @@ def send_email(
         _send_via_ses_api(config, subject, body, recipients)
 
 
+@lru_cache(maxsize=None)
+def _ses_client(region: str | None) -> object:
+    """Return an SES client per region, reused across warm invocations."""
+    return boto3.client("ses", region_name=region, config=_SES_CLIENT_CONFIG)
+
+
 def _send_via_ses_api(config: AppConfig, subject: str, body: str, recipients: Sequence[str]) -> None:
-    client = boto3.client("ses", region_name=config.ses_secrets.region)
+    client = _ses_client(config.ses_secrets.region)
     request_kwargs: Dict[str, object] = {}
     if config.ses_secrets.reply_to:
         request_kwargs["ReplyToAddresses"] = list(config.ses_secrets.reply_to)
-    try:
+    message = {
+        "Subject": {"Data": subject, "Charset": "UTF-8"},
+        "Body": {"Text": {"Data": body, "Charset": "UTF-8"}},
+    }
+
+    def send_batch(batch: Sequence[str]) -> None:
         client.send_email(
             Source=config.ses_secrets.sender,
-            Destination={"ToAddresses": list(recipients)},
-            Message={
-                "Subject": {"Data": subject, "Charset": "UTF-8"},
-                "Body": {"Text": {"Data": body, "Charset": "UTF-8"}},
-            },
+            Destination={"ToAddresses": list(batch)},
+            Message=message,
             **request_kwargs,
         )
+
+    # SES accepts at most 50 destinations per message; larger lists go out as
+    # several messages sent concurrently over the shared client.
+    batches = [
+        recipients[start : start + _SES_MAX_RECIPIENTS]
+        for start in range(0, len(recipients), _SES_MAX_RECIPIENTS)
+    ]
+    try:
+        if len(batches) == 1:
+            send_batch(batches[0])
+        else:
+            with ThreadPoolExecutor(max_workers=min(_SES_MAX_WORKERS, len(batches))) as executor:
+                list(executor.map(send_batch, batches))
         LOGGER.info("SES API email sent to %s", ", ".join(recipients))
     except (ClientError, BotoCoreError) as exc:
         LOGGER.exception("SES API send_email failed")
@@ -179,13 +226,50 @@ def _send_via_smtp(
         raise EmailDeliveryError("SMTP credentials are incomplete")
     port = secrets.port or 587
     message = _build_message(config, subject, body, recipients)
-    context = ssl.create_default_context()
-    try:
-        with smtplib.SMTP(secrets.host, port, timeout=20) as server:
-            server.starttls(context=context)
-            server.login(secrets.smtp_user, secrets.smtp_pass)
+    key = (secrets.host, port, secrets.smtp_user)
+    with _SMTP_LOCK:
+        try:
+            server = _get_smtp(key, secrets.smtp_pass)
             server.send_message(message)
-            LOGGER.info("SMTP email sent to %s", ", ".join(recipients))
-    except smtplib.SMTPException as exc:
-        LOGGER.exception("SMTP send failed")
-        raise EmailDeliveryError(str(exc))
+        except (smtplib.SMTPException, OSError) as exc:
+            _discard_smtp(key)
+            LOGGER.exception("SMTP send failed")
+            raise EmailDeliveryError(str(exc))
+        server_sent = _SMTP_POOL[key][1] + 1
+        if server_sent >= _SMTP_MAX_MESSAGES_PER_CONNECTION:
+            _discard_smtp(key)
+        else:
+            _SMTP_POOL[key] = (server, server_sent)
+    LOGGER.info("SMTP email sent to %s", ", ".join(recipients))
+
+
+def _get_smtp(key: Tuple[str, int, str], password: str) -> smtplib.SMTP:
+    """Return a logged-in connection for key, reusing a live pooled one."""
+    pooled = _SMTP_POOL.get(key)
+    if pooled is not None:
+        try:
+            if pooled[0].noop()[0] == 250:
+                return pooled[0]
+        except (smtplib.SMTPException, OSError):
+            pass
+        _discard_smtp(key)
+    host, port, user = key
+    server = smtplib.SMTP(host, port, timeout=20)
+    try:
+        server.starttls(context=ssl.create_default_context())
+        server.login(user, password)
+    except BaseException:
+        server.close()
+        raise
+    _SMTP_POOL[key] = (server, 0)
+    return server
+
+
+def _discard_smtp(key: Tuple[str, int, str]) -> None:
+    pooled = _SMTP_POOL.pop(key, None)
+    if pooled is None:
+        return
+    try:
+        pooled[0].quit()
+    except (smtplib.SMTPException, OSError):
+        pooled[0].close()
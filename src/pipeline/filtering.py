@@ -4,17 +4,17 @@ from __future__ import annotations
 import logging
 import re
 import string
-from collections import defaultdict
 from dataclasses import dataclass
-from typing import Dict, Mapping, MutableMapping, Sequence, Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, Mapping, MutableMapping, Sequence, Tuple
 
-from util import PaperItem, highlight_text
+from util import PaperItem, compile_highlighter, highlight_text
 
 LOGGER = logging.getLogger(__name__)
 
 _TAG_RE = re.compile(r"<[^>]+>")
-_PUNCTUATION_RE = re.compile(rf"[{re.escape(string.punctuation)}]")
-_WHITESPACE_RE = re.compile(r"\s+")
+_PUNCTUATION_TABLE = str.maketrans({char: " " for char in string.punctuation})
+_MODE_AND = "AND"
 
 
 @dataclass(slots=True)
@@ -25,30 +25,19 @@ class FilterStats:
     post_keyword: int
     post_dedup: int
 
-    def as_dict(self, post_seen: int | None = None) -> Dict[str, int]:
-        summary: Dict[str, int] = {
-            "post_fetch": self.post_fetch,
-            "post_keyword": self.post_keyword,
-            "post_dedup": self.post_dedup,
-            "total": self.post_fetch,
-            "matched": self.post_keyword,
-            "unique": self.post_dedup,
-        }
-        if post_seen is not None:
-            summary["post_seen"] = post_seen
-        return summary
-
 
 def _strip_html(value: str) -> str:
     return _TAG_RE.sub(" ", value)
 
 
+# Warm invocations re-filter items from overlapping windows; normalizing is a
+# pure function of the text, so identical titles/summaries are done once.
+@lru_cache(maxsize=4096)
 def _normalize_field(value: str | None) -> str:
     if not value:
         return ""
-    lowered = _strip_html(value).lower()
-    without_punct = _PUNCTUATION_RE.sub(" ", lowered)
-    return _WHITESPACE_RE.sub(" ", without_punct).strip()
+    without_punct = _strip_html(value).translate(_PUNCTUATION_TABLE).lower()
+    return " ".join(without_punct.split())
 
 
 def _prepare_keywords(keywords: Sequence[str]) -> Sequence[Tuple[str, str]]:
@@ -70,75 +59,104 @@ def _prepare_keywords(keywords: Sequence[str]) -> Sequence[Tuple[str, str]]:
     return tuple(prepared)
 
 
-def keyword_match(
+@lru_cache(maxsize=32)
+def _compile_matcher(
+    keywords: Tuple[str, ...],
+    match_mode: str,
+) -> Tuple[Tuple[Tuple[str, str], ...], bool]:
+    """Return prepared keywords and whether all must match, cached per keyword set."""
+    return tuple(_prepare_keywords(keywords)), match_mode.upper() == _MODE_AND
+
+
+def _match_prepared(
     title: str | None,
     summary: str | None,
-    keywords: Sequence[str],
-    match_mode: str,
+    prepared_keywords: Sequence[Tuple[str, str]],
+    require_all: bool,
 ) -> tuple[bool, tuple[str, ...]]:
-    """Evaluate keyword containment against title/summary content."""
-
-    prepared_keywords = _prepare_keywords(keywords)
     if not prepared_keywords:
         return True, ()
 
     normalized_title = _normalize_field(title)
     normalized_summary = _normalize_field(summary)
-    haystacks = tuple(filter(None, (normalized_title, normalized_summary)))
-    if not haystacks:
+    if not normalized_title and not normalized_summary:
         return False, ()
+    # Normalized fields never contain newlines, so joining on one keeps a
+    # keyword from matching across the title/summary boundary.
+    haystack = f"{normalized_title}\n{normalized_summary}"
 
-    mode = match_mode.upper()
     matches: list[str] = []
     matched_tokens: set[str] = set()
 
     for normalized, original in prepared_keywords:
-        found = any(normalized in haystack for haystack in haystacks)
-        if found:
+        if normalized in haystack:
             if original not in matched_tokens:
                 matched_tokens.add(original)
                 matches.append(original)
-        elif mode == "AND":
+        elif require_all:
             return False, tuple(matches)
 
-    if mode == "AND":
+    if require_all:
         return len(matches) == len(prepared_keywords), tuple(matches)
     return bool(matches), tuple(matches)
 
 
+def keyword_match(
+    title: str | None,
+    summary: str | None,
+    keywords: Sequence[str],
+    match_mode: str,
+) -> tuple[bool, tuple[str, ...]]:
+    """Evaluate keyword containment against title/summary content."""
+
+    prepared_keywords, require_all = _compile_matcher(tuple(keywords), match_mode)
+    return _match_prepared(title, summary, prepared_keywords, require_all)
+
+
 def filter_items(
-    items_by_source: Mapping[str, Sequence[PaperItem]],
+    items_by_source: Mapping[str, Iterable[PaperItem]],
     keywords: Sequence[str],
     match_mode: str,
 ) -> tuple[Dict[str, list[PaperItem]], FilterStats]:
-    """Filter items by keywords and deduplicate by paper_id."""
+    """Filter items by keywords and deduplicate by paper_id.
+
+    Each source may be any iterable; items are consumed once, so generators are
+    filtered without being materialized first.
+    """
 
-    total_candidates = sum(len(items) for items in items_by_source.values())
+    prepared_keywords, require_all = _compile_matcher(tuple(keywords), match_mode)
+    total_candidates = 0
     matched_candidates = 0
     seen_ids: set[str] = set()
-    filtered: Dict[str, list[PaperItem]] = defaultdict(list)
+    filtered: Dict[str, list[PaperItem]] = {}
 
     for source, items in items_by_source.items():
         for item in items:
+            total_candidates += 1
             if item.matched_keywords:
                 matched = True
                 matched_terms = tuple(item.matched_keywords)
+            elif not prepared_keywords:
+                matched, matched_terms = True, ()
             else:
-                matched, matched_terms = keyword_match(item.title, item.summary, keywords, match_mode)
+                matched, matched_terms = _match_prepared(
+                    item.title, item.summary, prepared_keywords, require_all
+                )
             if not matched:
                 continue
             matched_candidates += 1
-            paper_id = item.paper_id.lower()
+            paper_id = item.paper_id_key
             if paper_id in seen_ids:
                 continue
             seen_ids.add(paper_id)
             if matched_terms:
                 highlight_terms = tuple(dict.fromkeys(matched_terms))
-                item.title = highlight_text(item.title, highlight_terms)
+                highlighter = compile_highlighter(highlight_terms)
+                item.title = highlight_text(item.title, highlight_terms, highlighter)
                 if item.summary:
-                    item.summary = highlight_text(item.summary, highlight_terms)
+                    item.summary = highlight_text(item.summary, highlight_terms, highlighter)
                 item.matched_keywords = highlight_terms
-            filtered[source].append(item)
+            filtered.setdefault(source, []).append(item)
 
     stats = FilterStats(
         post_fetch=total_candidates,
@@ -154,4 +172,4 @@ def filter_items(
         len(seen_ids),
     )
 
-    return {source: entries for source, entries in filtered.items()}, stats
+    return filtered, stats
@@ -1,11 +1,15 @@
 """Crossref source integration."""
 from __future__ import annotations
 
+import html
+import json
 import logging
+import re
 import time
 from datetime import datetime, timezone
 from os import getenv
 from typing import Dict, List, Sequence
+from urllib.parse import unquote
 
 import requests
 from tenacity import RetryError, retry, retry_if_exception_type, stop_after_attempt, wait_exponential
@@ -13,6 +17,11 @@ from tenacity import RetryError, retry, retry_if_exception_type, stop_after_atte
 from pipeline.filtering import keyword_match
 from util import PaperItem
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # pragma: no cover - optional speedup
+    _json_loads = json.loads
+
 LOGGER = logging.getLogger(__name__)
 
 CROSSREF_URL = "https://api.crossref.org/works"
@@ -49,6 +58,12 @@ DEFAULT_TIMEOUT = 10
 # Limit the number of journals queried per run to keep request volume manageable.
 # The value can be overridden with the CROSSREF_JOURNAL_LIMIT environment variable.
 DEFAULT_JOURNAL_LIMIT = 3
+# Rows per cursor page (Crossref's maximum) and a guard against runaway paging.
+PAGE_ROWS = 1000
+MAX_PAGES = 10
+
+
+_TAG_RE = re.compile(r"<[^>]*>")
 
 
 class RateLimitError(Exception):
@@ -87,22 +102,11 @@ def _extract_date(message: Dict[str, object]) -> datetime | None:
 def _cleanup_abstract(raw: str | None) -> str | None:
     if not raw:
         return None
-    return requests.utils.unquote(_strip_tags(raw))
+    return unquote(html.unescape(_strip_tags(raw)))
 
 
 def _strip_tags(raw: str) -> str:
-    text = []
-    in_tag = False
-    for char in raw:
-        if char == "<":
-            in_tag = True
-            continue
-        if char == ">":
-            in_tag = False
-            continue
-        if not in_tag:
-            text.append(char)
-    return "".join(text)
+    return _TAG_RE.sub("", raw)
 
 
 def _collect_authors(message: Dict[str, object]) -> List[str]:
@@ -190,7 +194,17 @@ def fetch_crossref(
     *,
     max_journals: int | None = None,
 ) -> List[PaperItem]:
-    """Fetch papers from Crossref honoring the configured filters."""
+    """Fetch papers from Crossref honoring the configured filters.
+
+    All selected journals go into one query: Crossref ORs repeated filters of
+    the same name, so a single cursor-paginated request replaces one request
+    per journal.
+    """
+    limit = _resolve_journal_limit(max_journals)
+    selected_journals = JOURNALS if limit is None else JOURNALS[:limit]
+    if not selected_journals:
+        return []
+
     session = requests.Session()
     if contact_email:
         header_agent = f"PaperWatcher/1.0 (mailto:{contact_email})"
@@ -201,103 +215,134 @@ def fetch_crossref(
     start_date = window_start_dt.date().isoformat()
     end_date = window_end_dt.date().isoformat()
     keyword_query = _build_query(keywords)
+    journal_names = {journal.lower(): journal for journal in selected_journals}
     items: List[PaperItem] = []
 
-    limit = _resolve_journal_limit(max_journals)
-    selected_journals = JOURNALS if limit is None else JOURNALS[:limit]
+    params = {
+        "filter": ",".join(
+            [
+                *(f"container-title:{journal}" for journal in selected_journals),
+                f"from-pub-date:{start_date}",
+                f"until-pub-date:{end_date}",
+            ]
+        ),
+        "rows": str(PAGE_ROWS),
+        "sort": "published",
+        "order": "desc",
+        "select": "DOI,title,abstract,container-title,issued,URL,type,subject,author",
+        "cursor": "*",
+    }
+    if keyword_query:
+        params["query.title"] = keyword_query
+        if match_mode.upper() == "AND":
+            params["query"] = keyword_query
+    if contact_email:
+        params["mailto"] = contact_email
+    LOGGER.info(
+        "CROSSREF request: journals=%s window=%s~%s mode=%s keywords=%s params=%s",
+        list(selected_journals),
+        start_date,
+        end_date,
+        match_mode.upper(),
+        list(keywords),
+        _mask_params(params),
+    )
 
-    for journal in selected_journals:
-        matched_count = 0
-        params = {
-            "filter": ",".join(
-                [
-                    f"container-title:{journal}",
-                    f"from-pub-date:{start_date}",
-                    f"until-pub-date:{end_date}",
-                ]
-            ),
-            "rows": "200",
-            "sort": "published",
-            "order": "desc",
-            "select": "DOI,title,abstract,container-title,issued,URL,type,subject,author",
-        }
-        if keyword_query:
-            params["query.title"] = keyword_query
-            if match_mode.upper() == "AND":
-                params["query"] = keyword_query
-        if contact_email:
-            params["mailto"] = contact_email
-        LOGGER.info(
-            "CROSSREF request: journal=%s window=%s~%s mode=%s keywords=%s params=%s",
-            journal,
-            start_date,
-            end_date,
-            match_mode.upper(),
-            list(keywords),
-            _mask_params(params),
-        )
-        try:
-            response = _perform_request(session, params)
-        except RetryError:
-            LOGGER.exception("Failed to fetch Crossref data for %s", journal)
-            continue
-        payload = response.json()
-        message = payload.get("message") if isinstance(payload, dict) else None
-        records = message.get("items") if isinstance(message, dict) else None
-        if not isinstance(records, list):
-            LOGGER.warning("Crossref returned unexpected payload for %s", journal)
-            continue
-        total_results = message.get("total-results") if isinstance(message, dict) else "?"
-        safe_url = response.url
-        if safe_url and contact_email:
-            safe_url = safe_url.replace(contact_email, "***")
-        LOGGER.info(
-            "CROSSREF response: status=%s total=%s returned=%d url=%s",
-            response.status_code,
-            total_results,
-            len(records),
-            safe_url,
-        )
-        for record in records:
-            if not isinstance(record, dict):
-                continue
-            doi = record.get("DOI")
-            if not isinstance(doi, str):
-                continue
-            title_entries = record.get("title")
-            title = title_entries[0] if isinstance(title_entries, list) and title_entries else None
-            if not isinstance(title, str):
-                continue
-            published = _extract_date(record)
-            if published and published < window_start_dt:
-                continue
-            abstract_raw = record.get("abstract") if isinstance(record.get("abstract"), str) else None
-            abstract = _cleanup_abstract(abstract_raw)
-            authors = _collect_authors(record)
-            url = record.get("URL") if isinstance(record.get("URL"), str) else f"https://doi.org/{doi}"
-            matched, matched_terms = keyword_match(title, abstract, keywords, match_mode)
-            if not matched:
-                continue
-            matched_count += 1
-            items.append(
-                PaperItem(
-                    source="crossref",
-                    paper_id=doi.lower(),
-                    title=title,
-                    authors=authors,
-                    published=published,
-                    url=url,
-                    journal=journal,
-                    summary=abstract,
-                    matched_keywords=matched_terms,
-                )
+    with session:
+        for page in range(1, MAX_PAGES + 1):
+            try:
+                response = _perform_request(session, params)
+            except (RetryError, requests.RequestException, RateLimitError):
+                LOGGER.exception("Failed to fetch Crossref data (page %d)", page)
+                break
+            # Parse the raw bytes: response.json() would first decode the whole
+            # page into a str, holding a second full copy of it in memory.
+            try:
+                payload = _json_loads(response.content)
+            except ValueError:
+                LOGGER.warning("Crossref returned invalid JSON (page %d)", page)
+                break
+            message = payload.get("message") if isinstance(payload, dict) else None
+            records = message.get("items") if isinstance(message, dict) else None
+            if not isinstance(records, list):
+                LOGGER.warning("Crossref returned unexpected payload (page %d)", page)
+                break
+            total_results = message.get("total-results")
+            safe_url = response.url
+            if safe_url and contact_email:
+                safe_url = safe_url.replace(contact_email, "***")
+            LOGGER.info(
+                "CROSSREF response: status=%s page=%d total=%s returned=%d url=%s",
+                response.status_code,
+                page,
+                total_results,
+                len(records),
+                safe_url,
+            )
+            matched_count = 0
+            for record in records:
+                item = _parse_record(record, journal_names, keywords, match_mode, window_start_dt)
+                if item is not None:
+                    matched_count += 1
+                    items.append(item)
+            LOGGER.info(
+                "CROSSREF processed: page=%d returned=%d matched=%d window=%s~%s",
+                page,
+                len(records),
+                matched_count,
+                start_date,
+                end_date,
             )
-        LOGGER.info(
-            "CROSSREF processed: journal=%s returned=%d matched=%d window=%s~%s",
-            journal,
-            len(records),
-            matched_count,
-            start_date,
-            end_date,
-        )
+            next_cursor = message.get("next-cursor")
+            if len(records) < PAGE_ROWS or not isinstance(next_cursor, str):
+                break
+            params["cursor"] = next_cursor
+        else:
+            LOGGER.warning("Crossref results truncated after %d pages", MAX_PAGES)
     return items
+
+
+def _parse_record(
+    record: object,
+    journal_names: Dict[str, str],
+    keywords: Sequence[str],
+    match_mode: str,
+    window_start_dt: datetime,
+) -> PaperItem | None:
+    if not isinstance(record, dict):
+        return None
+    doi = record.get("DOI")
+    if not isinstance(doi, str):
+        return None
+    title_entries = record.get("title")
+    title = title_entries[0] if isinstance(title_entries, list) and title_entries else None
+    if not isinstance(title, str):
+        return None
+    published = _extract_date(record)
+    if published and published < window_start_dt:
+        return None
+    abstract_raw = record.get("abstract")
+    abstract = _cleanup_abstract(abstract_raw if isinstance(abstract_raw, str) else None)
+    authors = _collect_authors(record)
+    url = record.get("URL")
+    if not isinstance(url, str):
+        url = f"https://doi.org/{doi}"
+    matched, matched_terms = keyword_match(title, abstract, keywords, match_mode)
+    if not matched:
+        return None
+    # The union query no longer says which journal a record came from; map the
+    # record's container title back to the configured journal name.
+    container_titles = record.get("container-title")
+    container = container_titles[0] if isinstance(container_titles, list) and container_titles else None
+    journal = journal_names.get(container.lower(), container) if isinstance(container, str) else None
+    return PaperItem(
+        source="crossref",
+        paper_id=doi.lower(),
+        title=title,
+        authors=authors,
+        published=published,
+        url=url,
+        journal=journal,
+        summary=abstract,
+        matched_keywords=matched_terms,
+    )
@@ -2,16 +2,23 @@
 Local storage module for deduplication tracking.
 
 Stores seen items in .data/seen.json with SHA-256 hashing and TTL-based cleanup.
+BloomSeenStorage adds a persisted Bloom filter so unseen items are rejected
+without reading the JSON store, and SqliteSeenStorage keeps the same records in
+an indexed SQLite table so lookups and writes do not scale with history size.
 """
 
 import hashlib
 import json
 import logging
+import os
 import re
+import sqlite3
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from typing import Any, Sequence
 
+from src.bloom import BloomFilter
 from src.crawler.interface import ResultItem
 
 logger = logging.getLogger(__name__)
@@ -19,6 +26,22 @@ logger = logging.getLogger(__name__)
 # Default storage path
 DEFAULT_STORAGE_PATH = Path(".data/seen.json")
 
+# Storage path suffixes that select the SQLite backend
+SQLITE_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+
+# Bound on host parameters per SQLite statement (SQLITE_MAX_VARIABLE_NUMBER on old builds)
+_SQLITE_BATCH_SIZE = 500
+
+# Default Bloom filter sizing
+DEFAULT_BLOOM_CAPACITY = 100_000
+DEFAULT_BLOOM_ERROR_RATE = 1e-6
+
+# Digests kept in memory; one run's results are hashed by lookup, mark and Bloom add
+_HASH_CACHE_SIZE = 4096
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
 
 def normalize_title(title: str) -> str:
     """
@@ -36,10 +59,10 @@ def normalize_title(title: str) -> str:
     normalized = title.lower()
 
     # Remove extra whitespace
-    normalized = re.sub(r'\s+', ' ', normalized)
+    normalized = _WHITESPACE_RE.sub(' ', normalized)
 
     # Remove common punctuation (keep alphanumeric and spaces)
-    normalized = re.sub(r'[^\w\s]', '', normalized)
+    normalized = _PUNCTUATION_RE.sub('', normalized)
 
     # Strip leading/trailing whitespace
     normalized = normalized.strip()
@@ -47,6 +70,7 @@ def normalize_title(title: str) -> str:
     return normalized
 
 
+@lru_cache(maxsize=_HASH_CACHE_SIZE)
 def compute_hash(url: str, title: str) -> str:
     """
     Compute SHA-256 hash of URL and normalized title.
@@ -65,6 +89,38 @@ def compute_hash(url: str, title: str) -> str:
     return hash_obj.hexdigest()
 
 
+def dedup_key(url: str, title: str) -> int:
+    """
+    Compute a compact 64-bit dedup key for URL and normalized title.
+
+    Collisions only become likely around 2**32 keys, far beyond the size of
+    any seen store, so the key stands in for the full SHA-256 hex digest
+    wherever the store does not need to stay human-readable.
+
+    Args:
+        url: Item URL
+        title: Item title (will be normalized)
+
+    Returns:
+        Signed 64-bit integer, suitable for an SQLite INTEGER column
+    """
+    composite_key = f"{url}\x00{normalize_title(title)}"
+    digest = hashlib.blake2b(composite_key.encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little', signed=True)
+
+
+def _parse_seen_at(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        seen_at = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if seen_at.tzinfo is None:
+        seen_at = seen_at.replace(tzinfo=timezone.utc)
+    return seen_at
+
+
 class SeenStorage:
     """
     Manages seen items storage with TTL-based cleanup.
@@ -82,6 +138,8 @@ class SeenStorage:
         """
         self.storage_path = Path(storage_path)
         self.dedup_window_days = dedup_window_days
+        # Parsed store keyed by the file's (st_mtime_ns, st_size) when it was read
+        self._cache: tuple[tuple[int, int], dict[str, dict[str, Any]]] | None = None
 
         # Ensure .data directory exists
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
@@ -105,14 +163,23 @@ class SeenStorage:
                 }
             }
         """
-        if not self.storage_path.exists():
+        try:
+            stat = self.storage_path.stat()
+        except FileNotFoundError:
             logger.debug(f"Storage file does not exist: {self.storage_path}")
+            self._cache = None
             return {}
 
+        # Reuse the parsed store while the file is unchanged on disk
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if self._cache is not None and self._cache[0] == signature:
+            return self._cache[1]
+
         try:
-            with open(self.storage_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(self.storage_path, 'rb') as f:
+                data = json.loads(f.read())
 
+            self._cache = (signature, data)
             logger.info(f"Loaded {len(data)} seen items from storage")
             return data
 
@@ -127,16 +194,29 @@ class SeenStorage:
         """
         Save seen items to storage file.
 
+        The store is written to a temporary file, synced once, and renamed over
+        the original, so a crash mid-write never leaves a truncated store.
+
         Args:
             seen_items: Dictionary of seen items to save
         """
+        tmp_path = self.storage_path.with_suffix(self.storage_path.suffix + ".tmp")
         try:
-            with open(self.storage_path, 'w', encoding='utf-8') as f:
-                json.dump(seen_items, f, indent=2, ensure_ascii=False)
-
+            # Serialize up front so the file is written with a single write call
+            payload = json.dumps(seen_items, indent=2, ensure_ascii=False).encode('utf-8')
+            with open(tmp_path, 'wb') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.storage_path)
+
+            stat = self.storage_path.stat()
+            self._cache = ((stat.st_mtime_ns, stat.st_size), seen_items)
             logger.info(f"Saved {len(seen_items)} seen items to storage")
 
         except Exception as e:
+            self._cache = None
+            tmp_path.unlink(missing_ok=True)
             logger.error(f"Failed to save storage: {e}")
             raise
 
@@ -187,6 +267,36 @@ class SeenStorage:
         logger.debug(f"Item already seen within TTL: {item.url}")
         return True
 
+    def batch_is_seen(self, items: Sequence[ResultItem]) -> list[bool]:
+        """
+        Check several items against storage with a single load.
+
+        Unlike is_seen, expired records are reported as unseen but not pruned;
+        the following mark_seen call overwrites them.
+
+        Args:
+            items: ResultItems to check
+
+        Returns:
+            List of flags aligned with items, True where the item was seen within the dedup window
+        """
+        if not items:
+            return []
+        return self._hashes_seen([compute_hash(item.url, item.title) for item in items])
+
+    def _hashes_seen(self, hashes: Sequence[str]) -> list[bool]:
+        seen_items = self.load_seen()
+        if not seen_items:
+            return [False] * len(hashes)
+
+        cutoff = datetime.now(timezone.utc) - timedelta(days=self.dedup_window_days)
+        flags = []
+        for item_hash in hashes:
+            record = seen_items.get(item_hash)
+            seen_at = _parse_seen_at(record.get("seen_at")) if record else None
+            flags.append(seen_at is not None and seen_at >= cutoff)
+        return flags
+
     def mark_seen(self, items: list[ResultItem]) -> None:
         """
         Mark multiple items as seen.
@@ -258,6 +368,7 @@ class SeenStorage:
 
         Use with caution - this will allow all previously seen items to be sent again.
         """
+        self._cache = None
         if self.storage_path.exists():
             self.storage_path.unlink()
             logger.warning(f"Storage reset: deleted {self.storage_path}")
@@ -294,3 +405,283 @@ class SeenStorage:
             "oldest_record": min(timestamps).isoformat() if timestamps else None,
             "newest_record": max(timestamps).isoformat() if timestamps else None,
         }
+
+
+class BloomSeenStorage(SeenStorage):
+    """
+    SeenStorage fronted by a Bloom filter persisted next to the JSON file.
+
+    The filter never yields false negatives, so a miss proves an item is new
+    and the JSON store is only consulted for probable hits.
+    """
+
+    def __init__(
+        self,
+        storage_path: Path | str = DEFAULT_STORAGE_PATH,
+        dedup_window_days: int = 14,
+        bloom_path: Path | str | None = None,
+        capacity: int = DEFAULT_BLOOM_CAPACITY,
+        error_rate: float = DEFAULT_BLOOM_ERROR_RATE,
+    ):
+        """
+        Initialize storage manager and load or rebuild the Bloom filter.
+
+        Args:
+            storage_path: Path to storage JSON file
+            dedup_window_days: Number of days to keep seen records
+            bloom_path: Path to the Bloom filter file (default: storage path with .bloom suffix)
+            capacity: Minimum number of keys the filter is sized for
+            error_rate: Target false positive rate
+        """
+        super().__init__(storage_path=storage_path, dedup_window_days=dedup_window_days)
+        self.bloom_path = Path(bloom_path) if bloom_path else self.storage_path.with_suffix(".bloom")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.bloom = self._load_bloom()
+
+    def _bloom_is_current(self, bloom: BloomFilter | None) -> bool:
+        if bloom is None or bloom.count > bloom.capacity:
+            return False
+        if not self.storage_path.exists():
+            return True
+        # Any write to the JSON store that bypassed this class invalidates the filter.
+        return self.bloom_path.stat().st_mtime_ns >= self.storage_path.stat().st_mtime_ns
+
+    def _load_bloom(self) -> BloomFilter:
+        bloom = BloomFilter.load(self.bloom_path)
+        if self._bloom_is_current(bloom):
+            logger.debug(f"Loaded bloom filter: {self.bloom_path} ({bloom.count} keys)")
+            return bloom
+        return self._rebuild_bloom()
+
+    def _rebuild_bloom(self) -> BloomFilter:
+        seen_items = self.load_seen()
+        bloom = BloomFilter.for_capacity(max(self.capacity, 2 * len(seen_items)), self.error_rate)
+        bloom.add_many(seen_items.keys())
+        bloom.save(self.bloom_path)
+        logger.info(f"Rebuilt bloom filter from {len(seen_items)} seen items")
+        return bloom
+
+    def is_seen(self, item: ResultItem) -> bool:
+        """
+        Check if an item has been seen before.
+
+        Args:
+            item: ResultItem to check
+
+        Returns:
+            True if item was seen within the dedup window, False otherwise
+        """
+        if compute_hash(item.url, item.title) not in self.bloom:
+            return False
+        return super().is_seen(item)
+
+    def batch_is_seen(self, items: Sequence[ResultItem]) -> list[bool]:
+        """
+        Check several items, reading the JSON store only for Bloom filter hits.
+
+        Args:
+            items: ResultItems to check
+
+        Returns:
+            List of flags aligned with items, True where the item was seen within the dedup window
+        """
+        flags = [False] * len(items)
+        # Hash each item once; the same digest feeds the filter and the JSON lookup
+        candidates = []
+        for index, item in enumerate(items):
+            item_hash = compute_hash(item.url, item.title)
+            if item_hash in self.bloom:
+                candidates.append((index, item_hash))
+        if candidates:
+            confirmed = self._hashes_seen([item_hash for _, item_hash in candidates])
+            for (index, _), seen in zip(candidates, confirmed):
+                flags[index] = seen
+        return flags
+
+    def mark_seen(self, items: list[ResultItem]) -> None:
+        """
+        Mark multiple items as seen and record them in the Bloom filter.
+
+        Args:
+            items: List of ResultItem objects to mark as seen
+        """
+        super().mark_seen(items)
+        if items:
+            self.bloom.add_many(compute_hash(item.url, item.title) for item in items)
+            self.bloom.save(self.bloom_path)
+
+    def reset_state(self) -> None:
+        """
+        Reset storage state (delete all seen records and the Bloom filter).
+
+        Use with caution - this will allow all previously seen items to be sent again.
+        """
+        super().reset_state()
+        self.bloom_path.unlink(missing_ok=True)
+        self.bloom = BloomFilter.for_capacity(self.capacity, self.error_rate)
+
+
+class SqliteSeenStorage:
+    """
+    Seen items storage backed by SQLite in WAL mode.
+
+    Records are keyed by the 64-bit dedup_key of URL + normalized title, stored
+    as the rowid, with the seen time as a UNIX timestamp indexed for TTL eviction.
+    """
+
+    def __init__(self, storage_path: Path | str = ".data/seen.db", dedup_window_days: int = 14):
+        """
+        Initialize storage manager and create the schema if needed.
+
+        Args:
+            storage_path: Path to the SQLite database file
+            dedup_window_days: Number of days to keep seen records
+        """
+        self.storage_path = Path(storage_path)
+        self.dedup_window_days = dedup_window_days
+
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.storage_path, isolation_level=None)
+        self._conn.executescript(
+            """
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            CREATE TABLE IF NOT EXISTS seen (k INTEGER PRIMARY KEY, ts INTEGER NOT NULL);
+            CREATE INDEX IF NOT EXISTS seen_ts ON seen (ts);
+            """
+        )
+
+        logger.debug(f"SqliteSeenStorage initialized: {self.storage_path} (TTL: {dedup_window_days} days)")
+
+    @staticmethod
+    def _key(item: ResultItem) -> int:
+        return dedup_key(item.url, item.title)
+
+    def _cutoff(self) -> int:
+        return int((datetime.now(timezone.utc) - timedelta(days=self.dedup_window_days)).timestamp())
+
+    def is_seen(self, item: ResultItem) -> bool:
+        """
+        Check if an item has been seen before.
+
+        Args:
+            item: ResultItem to check
+
+        Returns:
+            True if item was seen within the dedup window, False otherwise
+        """
+        row = self._conn.execute(
+            "SELECT 1 FROM seen WHERE k = ? AND ts >= ? LIMIT 1",
+            (self._key(item), self._cutoff()),
+        ).fetchone()
+        return row is not None
+
+    def batch_is_seen(self, items: Sequence[ResultItem]) -> list[bool]:
+        """
+        Check several items with indexed IN queries.
+
+        Args:
+            items: ResultItems to check
+
+        Returns:
+            List of flags aligned with items, True where the item was seen within the dedup window
+        """
+        keys = [self._key(item) for item in items]
+        cutoff = self._cutoff()
+        found: set[int] = set()
+        for start in range(0, len(keys), _SQLITE_BATCH_SIZE):
+            chunk = keys[start:start + _SQLITE_BATCH_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT k FROM seen WHERE ts >= ? AND k IN ({placeholders})",
+                (cutoff, *chunk),
+            )
+            found.update(row[0] for row in rows)
+        return [key in found for key in keys]
+
+    def mark_seen(self, items: list[ResultItem]) -> None:
+        """
+        Mark multiple items as seen in a single transaction.
+
+        Args:
+            items: List of ResultItem objects to mark as seen
+        """
+        if not items:
+            return
+        now = int(datetime.now(timezone.utc).timestamp())
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(
+                "INSERT INTO seen (k, ts) VALUES (?, ?) ON CONFLICT(k) DO UPDATE SET ts = excluded.ts",
+                ((self._key(item), now) for item in items),
+            )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        logger.info(f"Marked {len(items)} items as seen")
+
+    def cleanup_old_records(self) -> int:
+        """
+        Remove records older than the dedup window.
+
+        Returns:
+            Number of records removed
+        """
+        removed = self._conn.execute("DELETE FROM seen WHERE ts < ?", (self._cutoff(),)).rowcount
+        if removed:
+            logger.info(f"Removed {removed} expired seen records")
+        return removed
+
+    def reset_state(self) -> None:
+        """
+        Reset storage state (delete all seen records).
+
+        Use with caution - this will allow all previously seen items to be sent again.
+        """
+        removed = self._conn.execute("DELETE FROM seen").rowcount
+        logger.warning(f"Storage reset: deleted {removed} records from {self.storage_path}")
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get storage statistics.
+
+        Returns:
+            Dictionary with storage stats (count, oldest/newest records)
+        """
+        count, oldest, newest = self._conn.execute(
+            "SELECT COUNT(*), MIN(ts), MAX(ts) FROM seen"
+        ).fetchone()
+
+        def to_iso(ts: int | None) -> str | None:
+            return datetime.fromtimestamp(ts, timezone.utc).isoformat() if ts is not None else None
+
+        return {
+            "total_count": count,
+            "oldest_record": to_iso(oldest),
+            "newest_record": to_iso(newest),
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+
+def open_storage(
+    storage_path: Path | str = DEFAULT_STORAGE_PATH,
+    dedup_window_days: int = 14,
+) -> "BloomSeenStorage | SqliteSeenStorage":
+    """
+    Open the storage backend matching the path's file extension.
+
+    Args:
+        storage_path: Path to the storage file (.db/.sqlite/.sqlite3 selects SQLite)
+        dedup_window_days: Number of days to keep seen records
+
+    Returns:
+        SqliteSeenStorage for SQLite paths, otherwise the Bloom-fronted JSON storage
+    """
+    if Path(storage_path).suffix.lower() in SQLITE_SUFFIXES:
+        return SqliteSeenStorage(storage_path=storage_path, dedup_window_days=dedup_window_days)
+    return BloomSeenStorage(storage_path=storage_path, dedup_window_days=dedup_window_days)
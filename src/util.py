@@ -3,9 +3,11 @@ from __future__ import annotations
 
 import logging
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Iterable, List, Optional, Sequence
+from functools import lru_cache
+from typing import Iterable, List, Optional, Sequence, Tuple
 
 LOGGER = logging.getLogger(__name__)
 
@@ -23,6 +25,12 @@ class PaperItem:
     journal: Optional[str] = None
     summary: Optional[str] = None
     matched_keywords: Sequence[str] | None = None
+    paper_id_key: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Case-folded, interned identifier used for deduplication, computed once
+        # at ingestion so set lookups can short-circuit on identity.
+        self.paper_id_key = sys.intern(self.paper_id.lower())
 
     def published_iso(self) -> str:
         """Return the publication time as an ISO string in UTC."""
@@ -49,20 +57,30 @@ def parse_keywords(raw: str) -> List[str]:
     return [kw for kw in keywords if kw]
 
 
-def highlight_text(text: str, keywords: Sequence[str]) -> str:
-    """Wrap matched keywords with square brackets for emphasis."""
-    if not text or not keywords:
-        return text
-
-    pattern = re.compile(
-        "(" + "|".join(re.escape(kw) for kw in sorted(set(keywords), key=len, reverse=True)) + ")",
+@lru_cache(maxsize=256)
+def compile_highlighter(terms: Tuple[str, ...]) -> re.Pattern[str]:
+    """Compile one case-insensitive alternation for the given terms, longest first."""
+    return re.compile(
+        "(" + "|".join(re.escape(term) for term in sorted(set(terms), key=len, reverse=True)) + ")",
         re.IGNORECASE,
     )
 
-    def replacer(match: re.Match[str]) -> str:
-        return f"[{match.group(0)}]"
 
-    return pattern.sub(replacer, text)
+def highlight_text(
+    text: str,
+    keywords: Sequence[str],
+    pattern: re.Pattern[str] | None = None,
+) -> str:
+    """Wrap matched keywords with square brackets for emphasis.
+
+    Callers highlighting several fields with the same terms may pass the
+    pattern from ``compile_highlighter`` to skip the cache lookup.
+    """
+    if not text or not keywords:
+        return text
+    if pattern is None:
+        pattern = compile_highlighter(tuple(keywords))
+    return pattern.sub(r"[\g<0>]", text)
 
 
 def summarize_authors(authors: Sequence[str], max_names: int = 5) -> str:
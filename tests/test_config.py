@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+
+from src import config
+from src.config import ConfigLoader
+
+pytestmark = pytest.mark.unit
+
+
+class StubSecretsClient:
+    def __init__(self, secrets: dict[str, str]):
+        self.secrets = secrets
+        self.calls: list[str] = []
+
+    def get_secret_value(self, SecretId: str) -> dict[str, str]:
+        self.calls.append(SecretId)
+        if SecretId not in self.secrets:
+            raise ClientError({"Error": {"Code": "ResourceNotFoundException"}}, "GetSecretValue")
+        return {"SecretString": self.secrets[SecretId]}
+
+
+@pytest.fixture(autouse=True)
+def clear_secret_cache(monkeypatch):
+    monkeypatch.setattr(config, "_SECRET_CACHE", {})
+
+
+@pytest.fixture
+def make_loader(monkeypatch):
+    def factory(secrets: dict[str, str]) -> ConfigLoader:
+        client = StubSecretsClient(secrets)
+        monkeypatch.setattr(boto3, "client", lambda service, **kwargs: client)
+        return ConfigLoader()
+
+    return factory
+
+
+def test_load_secret_parses_json_object(make_loader):
+    loader = make_loader({"api": '{"pubmed_api_key": "key", "user_agent_email": "me@example.com"}'})
+
+    secrets = loader._load_api_secret("api")
+
+    assert secrets.pubmed_api_key == "key"
+    assert secrets.user_agent_email == "me@example.com"
+
+
+def test_load_secret_rejects_invalid_json(make_loader):
+    loader = make_loader({"api": "{not json"})
+
+    with pytest.raises(ValueError, match="not valid JSON"):
+        loader._load_secret("api")
+
+
+def test_load_secret_rejects_non_object(make_loader):
+    loader = make_loader({"api": "[1, 2]"})
+
+    with pytest.raises(ValueError, match="JSON object"):
+        loader._load_secret("api")
+
+
+def test_load_secret_propagates_client_errors(make_loader):
+    loader = make_loader({})
+
+    with pytest.raises(ClientError):
+        loader._load_secret("missing")
+
+
+def test_load_secret_is_cached_within_ttl(make_loader, monkeypatch):
+    loader = make_loader({"api": '{"pubmed_api_key": "key"}'})
+    client = loader._secrets_client
+
+    loader._load_secret("api")
+    loader._load_secret("api")
+    assert client.calls == ["api"]
+
+    monkeypatch.setattr(config, "_SECRET_TTL_SECONDS", 0.0)
+    loader._load_secret("api")
+    assert client.calls == ["api", "api"]
@@ -0,0 +1,117 @@
+"""
+Unit tests for config_loader module.
+
+Tests YAML loading, validation, and load caching.
+"""
+
+import os
+
+import pytest
+from pydantic import ValidationError
+
+# Mark all tests in this module as unit tests
+pytestmark = pytest.mark.unit
+
+from src.config_loader import load_config, split_csv
+
+CONFIG_TEMPLATE = """
+keywords: [{keywords}]
+provider: bing
+email:
+  from: alerts@example.com
+  to: [user@example.com]
+  subject_prefix: "[Test]"
+"""
+
+
+def write_config(path, keywords, mtime_ns=None):
+    """Write a minimal config file, optionally pinning its modification time."""
+    path.write_text(CONFIG_TEMPLATE.format(keywords=keywords), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_config_parses_yaml(tmp_path):
+    """Test that a valid config file is loaded."""
+    config_path = tmp_path / "config.yaml"
+    write_config(config_path, "parp, isg")
+
+    config = load_config(config_path)
+
+    assert config.keywords == ("parp", "isg")
+    assert config.email.sender == "alerts@example.com"
+
+
+def test_load_config_reloads_after_file_change(tmp_path):
+    """Test that the cache is invalidated when the file is modified."""
+    config_path = tmp_path / "config.yaml"
+    write_config(config_path, "parp", mtime_ns=1_000_000_000)
+    assert load_config(config_path).keywords == ("parp",)
+
+    write_config(config_path, "sting", mtime_ns=2_000_000_000)
+    assert load_config(config_path).keywords == ("sting",)
+
+
+def test_load_config_shares_cached_immutable_instance(tmp_path):
+    """Test that repeated loads reuse one immutable config."""
+    config_path = tmp_path / "config.yaml"
+    write_config(config_path, "parp")
+
+    first = load_config(config_path)
+
+    assert load_config(config_path) is first
+    assert isinstance(first.email.recipients, tuple)
+
+
+def test_sources_set_normalizes_urls(tmp_path):
+    """Test that sources_set lowercases and strips trailing slashes."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        CONFIG_TEMPLATE.format(keywords="parp").replace("provider: bing", "provider: http")
+        + "sources: ['https://Example.com/news/', 'https://example.com/news']\n",
+        encoding="utf-8",
+    )
+
+    config = load_config(config_path)
+
+    assert config.sources_set == frozenset({"https://example.com/news"})
+
+
+def test_load_config_missing_file(tmp_path):
+    """Test that a missing file raises FileNotFoundError."""
+    with pytest.raises(FileNotFoundError):
+        load_config(tmp_path / "missing.yaml")
+
+
+def test_load_config_is_frozen(tmp_path):
+    """Test that loaded configs reject attribute assignment."""
+    config_path = tmp_path / "config.yaml"
+    write_config(config_path, "parp")
+
+    config = load_config(config_path)
+
+    with pytest.raises(ValidationError):
+        config.provider = "http"
+
+
+def test_load_config_empty_file(tmp_path):
+    """Test that an empty file is rejected."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_bytes(b"")
+
+    with pytest.raises(ValueError, match="empty"):
+        load_config(config_path)
+
+
+def test_load_config_reads_utf8(tmp_path):
+    """Test that non-ASCII content survives the binary read."""
+    config_path = tmp_path / "config.yaml"
+    write_config(config_path, "인터페론, café")
+
+    assert load_config(config_path).keywords == ("인터페론", "café")
+
+
+def test_split_csv_trims_items():
+    """Test that comma-separated settings are split and trimmed in one pass."""
+    assert split_csv(" parp ,isg,  interferon ") == ["parp", "isg", "interferon"]
+    assert split_csv("sting") == ["sting"]
@@ -4,10 +4,17 @@ Unit tests for crawler module.
 Tests the interface, Bing crawler, HTTP crawler, and utilities.
 """
 
-import pytest
-from datetime import datetime
+import json
+import time
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch, MagicMock
 
+import pytest
+from bs4 import BeautifulSoup
+from urllib3.response import HTTPResponse
+
 # Mark all tests in this module as unit tests
 pytestmark = pytest.mark.unit
 
@@ -15,6 +22,7 @@ from src.crawler.interface import ICrawler, ResultItem
 from src.crawler.bing_crawler import BingCrawler
 from src.crawler.http_crawler import HttpCrawler
 from src.crawler.utils import (
+    create_retry,
     deduplicate_results,
     filter_empty_results,
     RobotsTxtChecker,
@@ -131,11 +139,22 @@ def test_robots_txt_checker_initialization():
     assert len(checker._cache) == 0
 
 
-@patch('urllib.robotparser.RobotFileParser.read')
-@patch('urllib.robotparser.RobotFileParser.can_fetch')
-def test_robots_txt_checker_allowed(mock_can_fetch, mock_read):
+ROBOTS_TXT = b"User-agent: *\nDisallow: /admin\n"
+
+
+def _robots_response(body=ROBOTS_TXT, headers=None):
+    """Build a urlopen() context manager returning a robots.txt body."""
+    response = MagicMock()
+    response.read.return_value = body
+    response.headers = headers or {}
+    response.__enter__.return_value = response
+    return response
+
+
+@patch('src.crawler.utils.urllib.request.urlopen')
+def test_robots_txt_checker_allowed(mock_urlopen):
     """Test RobotsTxtChecker allows crawling."""
-    mock_can_fetch.return_value = True
+    mock_urlopen.return_value = _robots_response()
 
     checker = RobotsTxtChecker()
     allowed = checker.is_allowed("https://example.com/page")
@@ -143,11 +162,10 @@ def test_robots_txt_checker_allowed(mock_can_fetch, mock_read):
     assert allowed is True
 
 
-@patch('urllib.robotparser.RobotFileParser.read')
-@patch('urllib.robotparser.RobotFileParser.can_fetch')
-def test_robots_txt_checker_disallowed(mock_can_fetch, mock_read):
+@patch('src.crawler.utils.urllib.request.urlopen')
+def test_robots_txt_checker_disallowed(mock_urlopen):
     """Test RobotsTxtChecker disallows crawling."""
-    mock_can_fetch.return_value = False
+    mock_urlopen.return_value = _robots_response()
 
     checker = RobotsTxtChecker()
     allowed = checker.is_allowed("https://example.com/admin")
@@ -155,6 +173,68 @@ def test_robots_txt_checker_disallowed(mock_can_fetch, mock_read):
     assert allowed is False
 
 
+@patch('src.crawler.utils.urllib.request.urlopen')
+def test_robots_txt_checker_caches_per_host_until_ttl(mock_urlopen):
+    """Test robots.txt is fetched once per host and refetched after the TTL."""
+    mock_urlopen.return_value = _robots_response()
+
+    checker = RobotsTxtChecker()
+    checker.is_allowed("https://example.com/a")
+    checker.is_allowed("https://example.com/b")
+    assert mock_urlopen.call_count == 1
+
+    checker.ttl_seconds = 0
+    checker._cache.clear()
+    checker.is_allowed("https://example.com/a")
+    checker.is_allowed("https://example.com/b")
+    assert mock_urlopen.call_count == 3
+
+
+@patch('src.crawler.utils.urllib.request.urlopen')
+def test_robots_txt_checker_caches_fetch_failures(mock_urlopen):
+    """Test an unreachable robots.txt allows crawling without refetching per URL."""
+    mock_urlopen.side_effect = urllib.error.URLError("connection refused")
+
+    checker = RobotsTxtChecker()
+
+    assert checker.is_allowed("https://example.com/a") is True
+    assert checker.is_allowed("https://example.com/b") is True
+    assert mock_urlopen.call_count == 1
+
+
+@patch('src.crawler.utils.urllib.request.urlopen')
+def test_robots_txt_checker_revalidates_with_validators(mock_urlopen):
+    """Test an expired entry is revalidated and a 304 keeps the parsed rules."""
+    mock_urlopen.return_value = _robots_response(
+        headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+    )
+    checker = RobotsTxtChecker(ttl_seconds=0)
+    assert checker.is_allowed("https://example.com/admin") is False
+
+    mock_urlopen.return_value = None
+    mock_urlopen.side_effect = urllib.error.HTTPError(
+        "https://example.com/robots.txt", 304, "Not Modified", {}, None
+    )
+    assert checker.is_allowed("https://example.com/admin") is False
+
+    request = mock_urlopen.call_args[0][0]
+    assert request.get_header("If-none-match") == '"v1"'
+    assert request.get_header("If-modified-since") == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert mock_urlopen.call_count == 2
+
+
+@patch('src.crawler.utils.urllib.request.urlopen')
+def test_robots_txt_checker_honours_max_age(mock_urlopen):
+    """Test Cache-Control max-age overrides the default TTL."""
+    mock_urlopen.return_value = _robots_response(headers={"Cache-Control": "public, max-age=60"})
+
+    checker = RobotsTxtChecker()
+    checker.is_allowed("https://example.com/a")
+
+    expiry = checker._cache["https://example.com"][1]
+    assert expiry - time.monotonic() <= 60
+
+
 def test_rate_limiter_initialization():
     """Test RateLimiter initialization."""
     limiter = RateLimiter(min_delay=1.0, max_delay=30.0)
@@ -167,10 +247,10 @@ def test_rate_limiter_error_recording():
     limiter = RateLimiter()
 
     limiter.record_error("example.com")
-    assert limiter._error_count["example.com"] == 1
+    assert limiter._hosts["example.com"].error_count == 1
 
     limiter.record_error("example.com")
-    assert limiter._error_count["example.com"] == 2
+    assert limiter._hosts["example.com"].error_count == 2
 
 
 def test_rate_limiter_success_resets_errors():
@@ -179,10 +259,82 @@ def test_rate_limiter_success_resets_errors():
 
     limiter.record_error("example.com")
     limiter.record_error("example.com")
-    assert limiter._error_count["example.com"] == 2
+    assert limiter._hosts["example.com"].error_count == 2
 
     limiter.record_success("example.com")
-    assert "example.com" not in limiter._error_count
+    assert limiter._hosts["example.com"].error_count == 0
+
+
+@patch('src.crawler.utils.time.sleep')
+@patch('src.crawler.utils.time.monotonic')
+def test_rate_limiter_token_bucket_allows_bursts(mock_monotonic, mock_sleep):
+    """Test a full bucket serves bursts immediately and then paces at min_delay."""
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter(min_delay=2.0, capacity=2)
+
+    limiter.wait("example.com")
+    limiter.wait("example.com")
+    mock_sleep.assert_not_called()
+
+    limiter.wait("example.com")
+    mock_sleep.assert_called_once_with(2.0)
+
+    # Other hosts have their own bucket
+    limiter.wait("other.com")
+    assert mock_sleep.call_count == 1
+
+
+@patch('src.crawler.utils.time.sleep')
+@patch('src.crawler.utils.time.monotonic')
+def test_rate_limiter_errors_slow_refill(mock_monotonic, mock_sleep):
+    """Test recorded errors double the refill interval up to max_delay."""
+    mock_monotonic.return_value = 100.0
+    limiter = RateLimiter(min_delay=1.0, max_delay=3.0)
+
+    limiter.wait("example.com")
+    limiter.record_error("example.com")
+    limiter.record_error("example.com")
+    limiter.wait("example.com")
+
+    mock_sleep.assert_called_once_with(3.0)
+
+
+def test_rate_limiter_is_thread_safe():
+    """Test concurrent callers never take more tokens than the bucket holds."""
+    limiter = RateLimiter(min_delay=60.0, capacity=5)
+
+    with patch('src.crawler.utils.time.sleep') as mock_sleep:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(limiter.wait, ["example.com"] * 20))
+
+    assert mock_sleep.call_count == 15
+    assert len(limiter._hosts) == 1
+
+
+def test_crawler_sessions_retry_transient_statuses():
+    """Test both crawlers mount the urllib3 retry policy on their sessions."""
+    crawlers = [
+        BingCrawler(api_key="test_key"),
+        HttpCrawler(source_urls=["https://example.com"]),
+    ]
+
+    for crawler in crawlers:
+        retry = crawler._session.get_adapter("https://example.com").max_retries
+        assert retry.total == 2
+        assert set(retry.status_forcelist) == {429, 500, 502, 503, 504}
+        assert retry.respect_retry_after_header is True
+        assert retry.raise_on_status is False
+
+
+@patch('urllib3.util.retry.time.sleep')
+def test_create_retry_caps_retry_after(mock_sleep):
+    """Test a huge Retry-After is capped at the backoff limit."""
+    retry = create_retry(backoff_max=10.0)
+    response = HTTPResponse(status=503, headers={"Retry-After": "86400"})
+
+    retry.sleep(response)
+
+    mock_sleep.assert_called_once_with(10.0)
 
 
 # ========== BingCrawler Tests ==========
@@ -207,13 +359,13 @@ def test_bing_crawler_search_empty_keywords():
         crawler.search([])
 
 
-@patch('src.crawler.bing_crawler.requests.get')
+@patch('src.crawler.bing_crawler.requests.Session.get')
 def test_bing_crawler_search_success(mock_get):
     """Test BingCrawler successful search."""
     # Mock API response
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {
+    mock_response.content = json.dumps({
         "webPages": {
             "totalEstimatedMatches": 100,
             "value": [
@@ -230,7 +382,7 @@ def test_bing_crawler_search_success(mock_get):
                 },
             ]
         }
-    }
+    }).encode('utf-8')
     mock_get.return_value = mock_response
 
     crawler = BingCrawler(api_key="test_key")
@@ -242,7 +394,42 @@ def test_bing_crawler_search_success(mock_get):
     assert results[1].title == "Test Article 2"
 
 
-@patch('src.crawler.bing_crawler.requests.get')
+@patch('src.crawler.bing_crawler.requests.Session.get')
+def test_bing_crawler_splits_keywords_into_queries(mock_get):
+    """Test BingCrawler issues one query per keyword chunk and merges in order."""
+    def fake_get(url, params=None, timeout=None):
+        response = Mock()
+        response.status_code = 200
+        first = params["q"].split(" OR ")[0].strip('"')
+        response.content = json.dumps({"webPages": {"value": [{
+            "name": f"Article on {first}",
+            "url": f"https://example.com/{first}",
+            "snippet": f"Snippet about {first}",
+        }]}}).encode('utf-8')
+        return response
+
+    mock_get.side_effect = fake_get
+
+    crawler = BingCrawler(api_key="test_key", keywords_per_query=2)
+    results = crawler.search(["parp", "isg", "sting", "cgas", "ifn"])
+
+    queries = sorted(call.kwargs["params"]["q"] for call in mock_get.call_args_list)
+    assert queries == ['"ifn"', '"parp" OR "isg"', '"sting" OR "cgas"']
+    assert [item.url for item in results] == [
+        "https://example.com/parp",
+        "https://example.com/sting",
+        "https://example.com/ifn",
+    ]
+
+
+def test_bing_crawler_build_query_neutralizes_embedded_quotes():
+    """Test embedded double quotes cannot break the quoted OR query."""
+    query = BingCrawler._build_query(["parp", 'the "sting" pathway'])
+
+    assert query == '"parp" OR "the sting pathway"'
+
+
+@patch('src.crawler.bing_crawler.requests.Session.get')
 def test_bing_crawler_rate_limit(mock_get):
     """Test BingCrawler handles rate limiting."""
     mock_response = Mock()
@@ -255,6 +442,17 @@ def test_bing_crawler_rate_limit(mock_get):
         crawler.search(["test"])
 
 
+def test_bing_crawler_parse_date():
+    """Test Bing timestamps parse as UTC and bad values become None."""
+    crawler = BingCrawler(api_key="test_key")
+
+    parsed = crawler._parse_date("2025-10-27T12:00:00.0000000Z")
+
+    assert parsed == datetime(2025, 10, 27, 12, 0, tzinfo=timezone.utc)
+    assert crawler._parse_date("not a date") is None
+    assert crawler._parse_date(None) is None
+
+
 # ========== HttpCrawler Tests ==========
 
 def test_http_crawler_initialization_no_sources():
@@ -269,6 +467,12 @@ def test_http_crawler_initialization_with_sources():
     assert len(crawler.source_urls) == 1
 
 
+def test_http_crawler_drops_repeated_sources():
+    """Test HttpCrawler ignores sources repeated with different case or trailing slash."""
+    crawler = HttpCrawler(source_urls=["https://example.com/news", "https://Example.com/news/"])
+    assert crawler.source_urls == ["https://example.com/news"]
+
+
 def test_http_crawler_search_empty_keywords():
     """Test HttpCrawler raises error with empty keywords."""
     crawler = HttpCrawler(source_urls=["https://example.com"])
@@ -277,7 +481,7 @@ def test_http_crawler_search_empty_keywords():
         crawler.search([])
 
 
-@patch('src.crawler.http_crawler.requests.get')
+@patch('src.crawler.http_crawler.requests.Session.get')
 def test_http_crawler_search_success(mock_get):
     """Test HttpCrawler successful crawl."""
     # Mock HTML response
@@ -298,7 +502,7 @@ def test_http_crawler_search_success(mock_get):
 
     mock_response = Mock()
     mock_response.status_code = 200
-    mock_response.content = html_content.encode('utf-8')
+    mock_response.iter_content.return_value = [html_content.encode('utf-8')]
     mock_get.return_value = mock_response
 
     crawler = HttpCrawler(
@@ -311,7 +515,30 @@ def test_http_crawler_search_success(mock_get):
     # The exact number depends on keyword matching logic
 
 
-@patch('src.crawler.http_crawler.requests.get')
+def test_http_crawler_matches_keywords_in_one_pass():
+    """Test keyword matching is case-insensitive and tolerates overlapping keywords."""
+    crawler = HttpCrawler(source_urls=["https://example.com"])
+
+    assert crawler._matches_keywords("New PARP1 Inhibitor", ("parp", "parp1"))
+    assert crawler._matches_keywords("Uses a.b notation", ("a.b",))
+    assert not crawler._matches_keywords("Uses axb notation", ("a.b",))
+
+
+def test_http_crawler_extracts_each_article_once():
+    """Test that an element matched by several selectors is processed once."""
+    soup = BeautifulSoup(
+        "<div class='paper article'><h2><a href='/p'>PARP paper title</a></h2></div>"
+        "<article><h2><a href='/a'>Another PARP article</a></h2></article>",
+        "html.parser",
+    )
+    crawler = HttpCrawler(source_urls=["https://example.com"])
+
+    results = crawler._extract_articles(soup, "https://example.com", ("parp",))
+
+    assert [item.url for item in results] == ["https://example.com/p", "https://example.com/a"]
+
+
+@patch('src.crawler.http_crawler.requests.Session.get')
 def test_http_crawler_server_error(mock_get):
     """Test HttpCrawler handles server errors."""
     mock_response = Mock()
@@ -328,6 +555,133 @@ def test_http_crawler_server_error(mock_get):
     assert len(results) == 0  # Failed requests return no results
 
 
+@patch('src.crawler.http_crawler.requests.Session.get')
+def test_http_crawler_merges_hosts_in_source_order(mock_get):
+    """Test HttpCrawler returns results in source order across hosts."""
+    def fake_get(url, timeout=None, stream=False):
+        response = Mock()
+        response.status_code = 200
+        response.iter_content.return_value = [(
+            f"<article><h2><a href='/item'>PARP study from {url}</a></h2>"
+            f"<p>parp findings</p></article>"
+        ).encode('utf-8')]
+        return response
+
+    mock_get.side_effect = fake_get
+
+    sources = ["https://b.example.org/list", "https://a.example.com/list"]
+    crawler = HttpCrawler(source_urls=sources, respect_robots_txt=False)
+    results = crawler.search(["parp"])
+
+    assert [item.url for item in results] == [
+        "https://b.example.org/item",
+        "https://a.example.com/item",
+    ]
+
+
+@patch('src.crawler.http_crawler.requests.Session.get')
+def test_http_crawler_drops_results_repeated_across_sources(mock_get):
+    """Test an article linked from several sources is returned once."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = [
+        b"<article><h2><a href='https://journal.example/paper'>PARP trial results</a></h2></article>"
+    ]
+    mock_get.return_value = mock_response
+
+    sources = ["https://a.example.com/list", "https://b.example.org/list"]
+    crawler = HttpCrawler(source_urls=sources, respect_robots_txt=False)
+    results = crawler.search(["parp"])
+
+    assert [item.url for item in results] == ["https://journal.example/paper"]
+
+
+@patch('src.crawler.http_crawler.requests.Session.get')
+def test_http_crawler_reuses_session_across_urls(mock_get):
+    """Test HttpCrawler sends every page fetch through one pooled session."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = [b"<article><h2><a href='/x'>PARP inhibitor news</a></h2></article>"]
+    mock_get.return_value = mock_response
+
+    sources = ["https://example.com/a", "https://example.com/b"]
+    with HttpCrawler(source_urls=sources, respect_robots_txt=False) as crawler:
+        crawler.rate_limiter.min_delay = 0
+        crawler.search(["parp"])
+
+    assert [call.args[0] for call in mock_get.call_args_list] == sources
+    assert crawler._session.headers["User-Agent"] == crawler.user_agent
+
+
+def test_http_crawler_snippet_prefers_paragraph_with_most_keywords():
+    """Test snippet selection counts distinct keywords case-insensitively."""
+    soup = BeautifulSoup(
+        "<article><p>PARP only, parp again</p><p>PARP and ISG together</p></article>",
+        "html.parser",
+    )
+    crawler = HttpCrawler(source_urls=["https://example.com"])
+
+    assert crawler._extract_snippet(soup.article, ("parp", "isg")) == "PARP and ISG together"
+
+    # A keyword nested inside another one still counts
+    soup = BeautifulSoup(
+        "<article><p>parp alone here</p><p>parp1 inhibitor study</p></article>",
+        "html.parser",
+    )
+    assert crawler._extract_snippet(soup.article, ("parp1", "parp")) == "parp1 inhibitor study"
+
+
+def test_http_crawler_snippet_uses_supplied_fallback_text():
+    """Test the snippet fallback reuses caller-extracted text instead of re-walking the tree."""
+    soup = BeautifulSoup("<article><h2>PARP</h2></article>", "html.parser")
+    crawler = HttpCrawler(source_urls=["https://example.com"])
+
+    snippet = crawler._extract_snippet(soup.article, ("isg",), fallback_text="cached text")
+
+    assert snippet == "cached text"
+
+
+@patch('src.crawler.http_crawler.BeautifulSoup')
+@patch('src.crawler.http_crawler.requests.Session.get')
+def test_http_crawler_skips_parsing_pages_without_keywords(mock_get, mock_soup):
+    """Test pages whose raw HTML lacks every keyword are never parsed."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = [b"<article><h2>Unrelated news</h2></article>"]
+    mock_get.return_value = mock_response
+
+    crawler = HttpCrawler(source_urls=["https://example.com"], respect_robots_txt=False)
+
+    assert crawler.search(["parp", "interferon response"]) == []
+    mock_soup.assert_not_called()
+
+
+@patch('src.crawler.http_crawler.requests.Session.get')
+def test_http_crawler_prefilter_keeps_keywords_split_across_tags(mock_get):
+    """Test multi-word keywords spanning inline tags still reach the parser."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.iter_content.return_value = [
+        b"<article><h2><a href='/r'>Interferon <b>response</b> in tumours</a></h2></article>"
+    ]
+    mock_get.return_value = mock_response
+
+    crawler = HttpCrawler(source_urls=["https://example.com"], respect_robots_txt=False)
+    results = crawler.search(["interferon response"])
+
+    assert [item.url for item in results] == ["https://example.com/r"]
+
+
+def test_http_crawler_caps_response_body():
+    """Test that streamed bodies stop being read at max_body_bytes."""
+    crawler = HttpCrawler(source_urls=["https://example.com"], max_body_bytes=10)
+    response = Mock()
+    response.iter_content.return_value = iter([b"0123456", b"789abc", b"never read"])
+
+    assert crawler._read_body(response, "https://example.com") == b"0123456789"
+    assert next(response.iter_content.return_value) == b"never read"
+
+
 # ========== Integration Tests ==========
 
 def test_crawler_interface_contract():
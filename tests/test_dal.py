@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from src.dal import SeenRepository
+from src.util import PaperItem
+
+pytestmark = pytest.mark.unit
+
+
+@mock_aws
+def test_which_seen_returns_only_recorded_ids() -> None:
+    client = boto3.client("dynamodb", region_name="us-east-1")
+    client.create_table(
+        TableName="seen",
+        KeySchema=[{"AttributeName": "paper_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "paper_id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    for paper_id in ("doi:1", "doi:150"):
+        client.put_item(TableName="seen", Item={"paper_id": {"S": paper_id}})
+
+    repository = SeenRepository("seen", client=client)
+    candidates = [f"doi:{index}" for index in range(200)] + ["doi:1"]
+
+    assert repository.which_seen(candidates) == {"doi:1", "doi:150"}
+    assert repository.which_seen([]) == set()
+
+
+def test_which_seen_retries_unprocessed_keys_with_backoff() -> None:
+    unprocessed = {"seen": {"Keys": [{"paper_id": {"S": "doi:2"}}]}}
+    client = MagicMock()
+    client.batch_get_item.side_effect = [
+        {"Responses": {"seen": [{"paper_id": {"S": "doi:1"}}]}, "UnprocessedKeys": unprocessed},
+        {"Responses": {"seen": []}, "UnprocessedKeys": unprocessed},
+        {"Responses": {"seen": [{"paper_id": {"S": "doi:2"}}]}, "UnprocessedKeys": {}},
+    ]
+
+    repository = SeenRepository("seen", client=client)
+    with patch("src.dal.time.sleep") as sleep:
+        assert repository.which_seen(["doi:1", "doi:2", "doi:3"]) == {"doi:1", "doi:2"}
+
+    assert client.batch_get_item.call_count == 3
+    assert client.batch_get_item.call_args.kwargs["RequestItems"] == unprocessed
+    assert [call.args[0] for call in sleep.call_args_list] == [0.05, 0.1]
+
+
+def _paper(index: int) -> PaperItem:
+    return PaperItem(
+        source="crossref",
+        paper_id=f"doi:{index}",
+        title=f"Paper {index}",
+        authors=(),
+        published=None,
+        url=f"https://doi.org/{index}",
+    )
+
+
+@mock_aws
+def test_mark_seen_writes_every_chunk() -> None:
+    client = boto3.client("dynamodb", region_name="us-east-1")
+    client.create_table(
+        TableName="seen",
+        KeySchema=[{"AttributeName": "paper_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[{"AttributeName": "paper_id", "AttributeType": "S"}],
+        BillingMode="PAY_PER_REQUEST",
+    )
+    repository = SeenRepository("seen", client=client)
+
+    repository.mark_seen([_paper(index) for index in range(60)])
+
+    assert repository.which_seen([f"doi:{index}" for index in range(70)]) == {
+        f"doi:{index}" for index in range(60)
+    }
+
+
+def test_mark_seen_retries_unprocessed_items() -> None:
+    client = MagicMock()
+    client.batch_write_item.side_effect = [
+        {"UnprocessedItems": {"seen": [{"PutRequest": {"Item": {}}}]}},
+        {"UnprocessedItems": {}},
+    ]
+    repository = SeenRepository("seen", client=client)
+
+    with patch("src.dal.time.sleep") as sleep:
+        repository.mark_seen([_paper(1), _paper(2)])
+
+    assert client.batch_write_item.call_count == 2
+    assert client.batch_write_item.call_args.kwargs["RequestItems"] == {
+        "seen": [{"PutRequest": {"Item": {}}}]
+    }
+    sleep.assert_called_once()
+
+
+def test_which_seen_skips_ids_already_known_as_seen() -> None:
+    client = MagicMock()
+    client.batch_get_item.return_value = {
+        "Responses": {"seen": [{"paper_id": {"S": "doi:1"}}]},
+        "UnprocessedKeys": {},
+    }
+    client.batch_write_item.return_value = {"UnprocessedItems": {}}
+    repository = SeenRepository("seen", client=client)
+
+    assert repository.which_seen(["doi:1", "doi:2"]) == {"doi:1"}
+    repository.mark_seen([_paper(3)])
+    client.batch_get_item.reset_mock()
+
+    assert repository.which_seen(["doi:1", "doi:3"]) == {"doi:1", "doi:3"}
+    client.batch_get_item.assert_not_called()
+    assert repository.is_seen("doi:3") is True
+    client.get_item.assert_not_called()
+
+
+def test_mark_seen_does_not_cache_items_left_unprocessed() -> None:
+    unprocessed = {
+        "seen": [{"PutRequest": {"Item": {"paper_id": {"S": "doi:2"}}}}],
+    }
+    client = MagicMock()
+    client.batch_write_item.return_value = {"UnprocessedItems": unprocessed}
+    client.batch_get_item.return_value = {"Responses": {"seen": []}, "UnprocessedKeys": {}}
+    repository = SeenRepository("seen", client=client)
+
+    with patch("src.dal.time.sleep"):
+        repository.mark_seen([_paper(1), _paper(2)])
+
+    assert repository.which_seen(["doi:1", "doi:2"]) == {"doi:1"}
+    requested = client.batch_get_item.call_args.kwargs["RequestItems"]["seen"]["Keys"]
+    assert requested == [{"paper_id": {"S": "doi:2"}}]
@@ -4,13 +4,16 @@ Unit tests for emailer module.
 Tests HTML generation, SES delivery (mocked), and SMTP delivery (mocked).
 """
 
+import json
+import threading
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, patch
 
 import pytest
 
 from src.crawler.interface import ResultItem
 from src.emailer import (
+    BufferedEmailer,
     EmailStats,
     Emailer,
     generate_html_email,
@@ -103,6 +106,41 @@ def test_generate_html_email_with_stats():
     assert "9" in html   # duplicates
 
 
+def test_generate_html_email_escapes_fields():
+    """Test titles, snippets and URLs are HTML-escaped."""
+    results = [
+        ResultItem(
+            "<script>alert(1)</script> & co",
+            'https://example.com/?a=1&b="2"',
+            "p < 0.05",
+        )
+    ]
+
+    html = generate_html_email(results, ["test"])
+
+    assert "<script>" not in html
+    assert "&lt;script&gt;alert(1)&lt;/script&gt; &amp; co" in html
+    assert 'href="https://example.com/?a=1&amp;b=&quot;2&quot;"' in html
+    assert "p &lt; 0.05" in html
+
+
+def test_generate_html_email_published_format():
+    """Test published timestamps render as minutes in UTC."""
+    results = [
+        ResultItem(
+            "Article",
+            "https://example.com",
+            "Snippet",
+            published_at=datetime(2025, 10, 27, 14, 30, 59, tzinfo=timezone.utc),
+        )
+    ]
+
+    html = generate_html_email(results, ["parp", "isg"])
+
+    assert "Published: 2025-10-27 14:30 UTC</small>" in html
+    assert "<strong>Keywords:</strong> parp, isg" in html
+
+
 def test_generate_html_email_long_snippet():
     """Test HTML with long snippet (should truncate)."""
     long_snippet = "A" * 500
@@ -220,7 +258,7 @@ def test_send_via_ses_success(mock_boto3):
     sent = emailer.send_email(results, ["test"])
 
     assert sent is True
-    mock_boto3.client.assert_called_once_with('ses', region_name='us-east-1')
+    mock_boto3.client.assert_called_once_with('ses', region_name='us-east-1', config=ANY)
     mock_ses.send_email.assert_called_once()
 
     # Check SES API call
@@ -229,6 +267,25 @@ def test_send_via_ses_success(mock_boto3):
     assert call_args[1]['Destination']['ToAddresses'] == ["to@example.com"]
 
 
+@patch('src.emailer.BOTO3_AVAILABLE', True)
+@patch('src.emailer.boto3')
+def test_send_via_ses_reuses_client(mock_boto3):
+    """Test the SES client is created once and reused across sends."""
+    mock_ses = MagicMock()
+    mock_ses.send_email.return_value = {"MessageId": "test-message-id"}
+    mock_boto3.client.return_value = mock_ses
+
+    emailer = Emailer(sender="from@example.com", recipients=["to@example.com"])
+    mock_boto3.client.assert_not_called()
+
+    results = [ResultItem("Test Article", "https://example.com", "Test snippet")]
+    assert emailer.send_email(results, ["test"]) is True
+    assert emailer.send_email(results, ["test"]) is True
+
+    assert mock_boto3.client.call_count == 1
+    assert mock_ses.send_email.call_count == 2
+
+
 @patch('src.emailer.BOTO3_AVAILABLE', True)
 @patch('src.emailer.boto3')
 def test_send_via_ses_failure_fallback_smtp(mock_boto3):
@@ -365,6 +422,91 @@ def test_emailer_blank_env_port_defaults_to_587():
         assert emailer.smtp_port == 587
 
 
+# ========== BufferedEmailer Tests ==========
+
+def test_buffered_emailer_queues_without_sending(tmp_path):
+    """Test that send_email only appends to the pending queue."""
+    inner = Mock()
+    buffered = BufferedEmailer(inner, pending_path=tmp_path / "pending.jsonl")
+    item = ResultItem("Article", "https://example.com/a", "Snippet")
+
+    assert buffered.send_email([item], ["parp"]) is True
+    assert buffered.send_email([], ["parp"]) is False
+
+    inner.send_email.assert_not_called()
+    assert len((tmp_path / "pending.jsonl").read_text().splitlines()) == 1
+
+
+def test_buffered_emailer_flush_waits_for_window(tmp_path):
+    """Test that entries are not sent before their flush window elapses."""
+    inner = Mock()
+    buffered = BufferedEmailer(inner, pending_path=tmp_path / "pending.jsonl")
+    buffered.send_email([ResultItem("Article", "https://example.com/a", "Snippet")], ["parp"])
+
+    assert buffered.flush() == 0
+    inner.send_email.assert_not_called()
+
+
+def test_buffered_emailer_keeps_entries_queued_during_flush(tmp_path):
+    """Test an entry queued while a digest is being sent survives the flush."""
+    pending_path = tmp_path / "pending.jsonl"
+    inner = Mock()
+    buffered = BufferedEmailer(inner, pending_path=pending_path, flush_delay_seconds=0)
+    buffered.send_email([ResultItem("Article A", "https://example.com/a", "Snippet")], ["parp"])
+    late = ResultItem("Article B", "https://example.com/b", "Snippet")
+    writer = threading.Thread(
+        target=BufferedEmailer(inner, pending_path=pending_path).send_email, args=([late], ["parp"])
+    )
+
+    def deliver(*args, **kwargs):
+        writer.start()
+        writer.join(timeout=0.2)
+        assert writer.is_alive()  # blocked on the queue lock until the flush finishes
+        return True
+
+    inner.send_email.side_effect = deliver
+
+    assert buffered.flush() == 1
+    writer.join(timeout=5)
+
+    entries = [json.loads(line) for line in pending_path.read_text().splitlines()]
+    assert [entry["results"][0]["url"] for entry in entries] == ["https://example.com/b"]
+
+
+def test_buffered_emailer_flush_sends_one_digest(tmp_path):
+    """Test that due entries are merged into a single deduplicated email."""
+    inner = Mock()
+    inner.send_email.return_value = True
+    pending_path = tmp_path / "pending.jsonl"
+    buffered = BufferedEmailer(inner, pending_path=pending_path, flush_delay_seconds=0)
+    first = ResultItem("Article A", "https://example.com/a", "Snippet", datetime.now(timezone.utc))
+    second = ResultItem("Article B", "https://example.com/b", "Snippet")
+    buffered.send_email([first], ["parp"])
+    buffered.send_email([first, second], ["parp", "isg"])
+
+    assert buffered.flush() == 2
+
+    inner.send_email.assert_called_once()
+    results, keywords, stats = inner.send_email.call_args[0]
+    assert [item.url for item in results] == ["https://example.com/a", "https://example.com/b"]
+    assert results[0].published_at == first.published_at
+    assert keywords == ["parp", "isg"]
+    assert stats.total_new == 2
+    assert not pending_path.exists()
+
+
+def test_buffered_emailer_keeps_entries_when_delivery_fails(tmp_path):
+    """Test that a failed digest leaves the queue intact."""
+    inner = Mock()
+    inner.send_email.return_value = False
+    pending_path = tmp_path / "pending.jsonl"
+    buffered = BufferedEmailer(inner, pending_path=pending_path)
+    buffered.send_email([ResultItem("Article", "https://example.com/a", "Snippet")], ["parp"])
+
+    assert buffered.flush(force=True) == 0
+    assert len(pending_path.read_text().splitlines()) == 1
+
+
 # ========== Integration Tests ==========
 
 @patch('src.emailer.boto3')
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pipeline.filtering import filter_items, keyword_match
+from pipeline.filtering import _normalize_field, filter_items, keyword_match
 from util import PaperItem
 
 
@@ -94,3 +94,59 @@ def test_keyword_match_ignores_punctuation_and_case():
         match_mode="OR",
     )
     assert matched_single is False
+
+
+def test_keyword_match_accepts_list_keywords():
+    matched, matched_terms = keyword_match(
+        title="Interferon signaling",
+        summary=None,
+        keywords=["interferon", "parp"],
+        match_mode="or",
+    )
+    assert matched is True
+    assert matched_terms == ("interferon",)
+
+
+def test_keyword_match_does_not_span_title_and_summary():
+    matched, _ = keyword_match(
+        title="Response to interferon",
+        summary="Gamma signaling in tumors",
+        keywords=('"interferon gamma"',),
+        match_mode="OR",
+    )
+    assert matched is False
+
+
+def test_filter_items_dedups_case_insensitive_paper_ids():
+    items = {
+        "crossref": [_make_item("10.1000/ABC", "Interferon response")],
+        "pubmed": [_make_item("10.1000/abc", "Interferon response")],
+    }
+
+    filtered, stats = filter_items(items, keywords=("interferon",), match_mode="OR")
+
+    assert stats.post_keyword == 2
+    assert stats.post_dedup == 1
+    assert list(filtered.keys()) == ["crossref"]
+
+
+def test_filter_items_consumes_generators():
+    def stream():
+        yield _make_item("g1", "Interferon response")
+        yield _make_item("g2", "Unrelated topic")
+
+    filtered, stats = filter_items({"rss": stream()}, keywords=("interferon",), match_mode="OR")
+
+    assert stats.post_fetch == 2
+    assert [item.paper_id for item in filtered["rss"]] == ["g1"]
+
+
+def test_filter_items_reuses_normalized_text_across_runs():
+    items = {"crossref": [_make_item("m1", "Memoized interferon response")]}
+    filter_items(items, keywords=("interferon",), match_mode="OR")
+    hits_before = _normalize_field.cache_info().hits
+
+    items = {"crossref": [_make_item("m1", "Memoized interferon response")]}
+    filter_items(items, keywords=("interferon",), match_mode="OR")
+
+    assert _normalize_field.cache_info().hits > hits_before
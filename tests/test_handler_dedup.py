@@ -17,6 +17,9 @@ class InMemoryRepository:
     def is_seen(self, paper_id: str) -> bool:
         return paper_id in self._seen
 
+    def which_seen(self, paper_ids: list[str]) -> set[str]:
+        return {paper_id for paper_id in paper_ids if paper_id in self._seen}
+
     def mark_seen(self, items: list[PaperItem]) -> None:
         for item in items:
             self._seen.add(item.paper_id)
@@ -4,6 +4,7 @@ Integration tests for Paper Watcher.
 Tests full workflow: crawl → dedup → email
 """
 
+import json
 import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
@@ -259,7 +260,7 @@ def test_workflow_with_no_results(temp_storage_path, sample_config):
 # ========== HTTP Crawler Integration Tests ==========
 
 @pytest.mark.integration
-@patch('src.crawler.http_crawler.requests.get')
+@patch('src.crawler.http_crawler.requests.Session.get')
 def test_http_crawler_with_mock_response(mock_get):
     """Test HTTP crawler with mocked response."""
     html_content = """
@@ -275,7 +276,7 @@ def test_http_crawler_with_mock_response(mock_get):
 
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.content = html_content.encode('utf-8')
+    mock_response.iter_content.return_value = [html_content.encode('utf-8')]
     mock_get.return_value = mock_response
 
     crawler = HttpCrawler(
@@ -292,12 +293,12 @@ def test_http_crawler_with_mock_response(mock_get):
 
 @pytest.mark.integration
 @pytest.mark.requires_api
-@patch('src.crawler.bing_crawler.requests.get')
+@patch('src.crawler.bing_crawler.requests.Session.get')
 def test_bing_crawler_with_mock_api(mock_get):
     """Test Bing crawler with mocked API response."""
     mock_response = MagicMock()
     mock_response.status_code = 200
-    mock_response.json.return_value = {
+    mock_response.content = json.dumps({
         "webPages": {
             "totalEstimatedMatches": 100,
             "value": [
@@ -309,7 +310,7 @@ def test_bing_crawler_with_mock_api(mock_get):
                 }
             ]
         }
-    }
+    }).encode('utf-8')
     mock_get.return_value = mock_response
 
     crawler = BingCrawler(api_key="test-key")
@@ -85,3 +85,24 @@ def test_query_parser_lenient_without_keyword_returns_none():
 def test_query_parser_strict_without_keyword_raises():
     with pytest.raises(ValueError):
         parse("system outage", policy=STRICT)
+
+
+def test_resolve_phrase_embedded_in_longer_query():
+    match = resolve("please send the passcode reset link")
+    assert match == {
+        "canonical_id": "password_reset",
+        "matched_term": "passcode reset",
+        "mode": "synonym",
+    }
+
+
+def test_resolve_requires_word_boundaries():
+    assert resolve("billing") is None
+
+
+def test_query_parser_shares_entry_mappings():
+    registry = load_keywords()
+    parsed = parse("password reset", policy=STRICT, registry=registry)
+    entry = registry.get(parsed.canonical_id)
+    assert parsed.filters is entry.filters
+    assert isinstance(parsed.to_dict()["filters"], dict)
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
 
 import boto3
 import pytest
 from moto import mock_aws
 
 from src.config import ApiSecrets, AppConfig, SesSecrets
-from src.mailer import send_email
+from src import mailer
+from src.mailer import EmailDeliveryError, _send_via_ses_api, _send_via_smtp, _ses_client, send_email
 from src.runtime import RuntimeOptions
 from src.util import PaperItem
 
@@ -91,3 +94,94 @@ def test_send_email_via_ses_dispatches_message():
     sent = backend.sent_messages[0]
     assert sent.source == "alerts@example.com"
     assert sent.destinations["ToAddresses"] == ["researcher@example.com"]
+
+
+@mock_aws
+def test_ses_client_is_reused_per_region():
+    assert _ses_client("us-east-1") is _ses_client("us-east-1")
+    assert _ses_client("us-east-1") is not _ses_client("eu-west-1")
+
+
+def _ses_config(recipients: tuple[str, ...]) -> AppConfig:
+    return AppConfig(
+        keywords=("parp",),
+        match_mode="OR",
+        window_hours=24,
+        sources=("crossref",),
+        app_name="paper-watcher",
+        ddb_table="paper-watcher-seen",
+        ses_secret_name="ses/secret",
+        api_secret_name="api/secret",
+        use_smtp=False,
+        api_secrets=ApiSecrets(pubmed_api_key=None, user_agent_email=None),
+        ses_secrets=SesSecrets(
+            sender="alerts@example.com",
+            recipients=recipients,
+            region="us-east-1",
+        ),
+    )
+
+
+def test_send_via_ses_api_splits_recipients_into_batches():
+    recipients = tuple(f"user{index}@example.com" for index in range(120))
+    client = MagicMock()
+
+    with patch("src.mailer._ses_client", return_value=client):
+        _send_via_ses_api(_ses_config(recipients), "subject", "body", recipients)
+
+    batches = [call.kwargs["Destination"]["ToAddresses"] for call in client.send_email.call_args_list]
+    assert sorted(len(batch) for batch in batches) == [20, 50, 50]
+    assert sorted(address for batch in batches for address in batch) == sorted(recipients)
+
+
+def test_send_via_ses_api_raises_when_a_batch_fails():
+    from botocore.exceptions import EndpointConnectionError
+
+    recipients = tuple(f"user{index}@example.com" for index in range(60))
+    client = MagicMock()
+    client.send_email.side_effect = [None, EndpointConnectionError(endpoint_url="https://ses")]
+
+    with patch("src.mailer._ses_client", return_value=client):
+        with pytest.raises(EmailDeliveryError):
+            _send_via_ses_api(_ses_config(recipients), "subject", "body", recipients)
+
+
+def _smtp_config() -> AppConfig:
+    config = _ses_config(("researcher@example.com",))
+    return replace(
+        config,
+        use_smtp=True,
+        ses_secrets=replace(
+            config.ses_secrets, smtp_user="user", smtp_pass="secret", host="smtp.example.com"
+        ),
+    )
+
+
+def test_send_via_smtp_reuses_logged_in_connection(monkeypatch):
+    monkeypatch.setattr(mailer, "_SMTP_POOL", {})
+    monkeypatch.setattr(mailer, "_SMTP_MAX_MESSAGES_PER_CONNECTION", 3)
+    server = MagicMock()
+    server.noop.return_value = (250, b"OK")
+
+    with patch("src.mailer.smtplib.SMTP", return_value=server) as smtp:
+        for _ in range(4):
+            _send_via_smtp(_smtp_config(), "subject", "body", ["researcher@example.com"])
+
+    # Three sends share one login; the fourth opens a fresh connection.
+    assert smtp.call_count == 2
+    assert server.login.call_count == 2
+    assert server.send_message.call_count == 4
+    assert server.quit.call_count == 1
+
+
+def test_send_via_smtp_reconnects_after_failure(monkeypatch):
+    monkeypatch.setattr(mailer, "_SMTP_POOL", {})
+    server = MagicMock()
+    server.send_message.side_effect = [OSError("connection reset"), None]
+
+    with patch("src.mailer.smtplib.SMTP", return_value=server) as smtp:
+        with pytest.raises(EmailDeliveryError):
+            _send_via_smtp(_smtp_config(), "subject", "body", ["researcher@example.com"])
+        _send_via_smtp(_smtp_config(), "subject", "body", ["researcher@example.com"])
+
+    assert smtp.call_count == 2
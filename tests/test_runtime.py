@@ -142,3 +142,42 @@ def test_fetch_sources_respects_event_preference(monkeypatch):
     assert calls == ["rss"]
     assert list(results.keys()) == ["rss"]
     assert counts["rss"] == 0
+
+
+def test_fetch_sources_keeps_source_order_and_skips_failures(monkeypatch):
+    def fake_rss(**kwargs):
+        return []
+
+    def failing_pubmed(**kwargs):
+        raise RuntimeError("boom")
+
+    def fake_crossref(**kwargs):
+        return []
+
+    monkeypatch.setattr(handler, "fetch_rss", fake_rss)
+    monkeypatch.setattr(handler, "fetch_pubmed", failing_pubmed)
+    monkeypatch.setattr(handler, "fetch_crossref", fake_crossref)
+
+    config = SimpleNamespace(
+        user_agent="agent",
+        api_secrets=SimpleNamespace(pubmed_api_key=None, user_agent_email=None),
+    )
+    runtime = RuntimeOptions(
+        keywords=("sting",),
+        sources=("crossref", "pubmed", "rss"),
+        match_mode="OR",
+        window_hours=24,
+        dry_run=True,
+        recipients_override=None,
+        force_send_summary=False,
+    )
+
+    results, counts = handler._fetch_sources(
+        config,
+        runtime,
+        window_start_dt=datetime.utcnow(),
+        window_end_dt=datetime.utcnow(),
+    )
+
+    assert list(results.keys()) == ["crossref", "rss"]
+    assert counts == {"crossref": 0, "rss": 0}
@@ -8,7 +8,7 @@ from urllib.parse import parse_qs, urlparse
 import pytest
 import responses
 
-from src.sources.crossref import CROSSREF_URL, fetch_crossref
+from src.sources.crossref import CROSSREF_URL, JOURNALS, _cleanup_abstract, fetch_crossref
 
 pytestmark = pytest.mark.unit
 
@@ -79,9 +79,13 @@ def test_fetch_crossref_keyword_matching_filters_by_journal():
         contact_email="alerts@example.com",
     )
 
-    # Three journals requested; ensure each triggered a request
-    assert len(responses.calls) == 3
+    # Three journals requested; all are ORed into a single request
+    assert len(responses.calls) == 1
     first_request = responses.calls[0].request
+    filter_value = parse_qs(urlparse(first_request.url).query)["filter"][0]
+    assert [part for part in filter_value.split(",") if part.startswith("container-title:")] == [
+        f"container-title:{journal}" for journal in JOURNALS[:3]
+    ]
     assert "alerts@example.com" in first_request.headers["User-Agent"]
 
     assert len(results) == 1
@@ -89,3 +93,52 @@ def test_fetch_crossref_keyword_matching_filters_by_journal():
     assert item.paper_id == "10.1234/example"
     assert item.source == "crossref"
     assert item.matched_keywords == ("interferon",)
+
+
+@responses.activate
+def test_fetch_crossref_follows_cursor_and_maps_journals(monkeypatch):
+    """Pages are followed via next-cursor and records are tagged with their journal."""
+    monkeypatch.setattr("src.sources.crossref.PAGE_ROWS", 2)
+    pages = {
+        "*": (["nature medicine", "Cell"], "page-2"),
+        "page-2": (["Science"], "page-3"),
+    }
+
+    def _callback(request) -> tuple[int, dict[str, str], str]:
+        cursor = parse_qs(urlparse(request.url).query)["cursor"][0]
+        containers, next_cursor = pages[cursor]
+        payload = _build_crossref_payload(
+            [
+                {
+                    "DOI": f"10.1000/{cursor}-{index}",
+                    "title": ["Interferon study"],
+                    "container-title": [container],
+                    "issued": {"date-parts": [[2025, 10, 20]]},
+                }
+                for index, container in enumerate(containers)
+            ]
+        )
+        payload["message"]["next-cursor"] = next_cursor
+        return 200, {"Content-Type": "application/json"}, json.dumps(payload)
+
+    responses.add_callback(responses.GET, CROSSREF_URL, callback=_callback, content_type="application/json")
+
+    results = fetch_crossref(
+        keywords=("Interferon",),
+        match_mode="OR",
+        window_start_dt=datetime(2025, 10, 18, tzinfo=timezone.utc),
+        window_end_dt=datetime(2025, 10, 27, tzinfo=timezone.utc),
+        user_agent="PaperWatcher/1.0",
+        contact_email=None,
+        max_journals=0,
+    )
+
+    assert len(responses.calls) == 2
+    assert [item.journal for item in results] == ["Nature Medicine", "Cell", "Science"]
+
+
+def test_cleanup_abstract_strips_tags_and_decodes_text():
+    raw = "<jats:title>Abstract</jats:title><jats:p>IFN &amp; PARP: p &lt; 0.05, 50%25 <i>in vivo</i></jats:p>"
+
+    assert _cleanup_abstract(raw) == "AbstractIFN & PARP: p < 0.05, 50% in vivo"
+    assert _cleanup_abstract(None) is None
@@ -6,6 +6,7 @@ Tests deduplication, hashing, TTL cleanup, and state management.
 
 import json
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -14,11 +15,16 @@ import pytest
 # Mark all tests in this module as unit tests
 pytestmark = pytest.mark.unit
 
+from src.bloom import BloomFilter
 from src.crawler.interface import ResultItem
 from src.storage import (
+    BloomSeenStorage,
     SeenStorage,
+    SqliteSeenStorage,
     compute_hash,
+    dedup_key,
     normalize_title,
+    open_storage,
 )
 
 
@@ -89,6 +95,16 @@ def test_compute_hash_title_normalization():
     assert hash1 == hash2 == hash3
 
 
+def test_compute_hash_is_memoized():
+    """Test that repeated hashing of the same item reuses the cached digest."""
+    compute_hash.cache_clear()
+    first = compute_hash("https://example.com/memo", "Memo Title")
+    second = compute_hash("https://example.com/memo", "Memo Title")
+
+    assert first == second
+    assert compute_hash.cache_info().hits == 1
+
+
 def test_compute_hash_different_urls():
     """Test that different URLs produce different hashes."""
     title = "Same Title"
@@ -113,6 +129,15 @@ def test_compute_hash_different_titles():
     assert hash1 != hash2
 
 
+def test_dedup_key_is_signed_64_bit_and_title_normalized():
+    """Test that dedup keys fit an SQLite INTEGER and ignore title formatting."""
+    key = dedup_key("https://example.com", "Test  Article!")
+
+    assert -(2 ** 63) <= key < 2 ** 63
+    assert key == dedup_key("https://example.com", "test article")
+    assert key != dedup_key("https://example.com/other", "test article")
+
+
 # ========== SeenStorage Tests ==========
 
 @pytest.fixture
@@ -391,6 +416,23 @@ def test_storage_json_format(temp_storage):
         assert record["hash"] == item_hash
 
 
+def test_save_seen_failure_keeps_previous_store(temp_storage, monkeypatch):
+    """Test that a failed save leaves the existing file intact and no temp file behind."""
+    temp_storage.mark_seen([ResultItem("Kept", "https://example.com/kept", "Snippet")])
+    before = temp_storage.storage_path.read_bytes()
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("src.storage.os.replace", fail_replace)
+
+    with pytest.raises(OSError):
+        temp_storage.mark_seen([ResultItem("Lost", "https://example.com/lost", "Snippet")])
+
+    assert temp_storage.storage_path.read_bytes() == before
+    assert list(temp_storage.storage_path.parent.glob("*.tmp")) == []
+
+
 # ========== Integration Tests ==========
 
 def test_deduplication_workflow(temp_storage):
@@ -427,5 +469,207 @@ def test_title_variation_deduplication(temp_storage):
     assert temp_storage.is_seen(item3) is True
 
 
+def test_batch_is_seen_matches_is_seen(temp_storage):
+    """Test that batch lookups agree with per-item lookups."""
+    seen = ResultItem("Seen", "https://example.com/seen", "Snippet")
+    new = ResultItem("New", "https://example.com/new", "Snippet")
+    temp_storage.mark_seen([seen])
+
+    assert temp_storage.batch_is_seen([seen, new, seen]) == [True, False, True]
+    assert temp_storage.batch_is_seen([]) == []
+
+
+def test_batch_is_seen_treats_expired_as_new(temp_storage):
+    """Test that batch lookups honour the dedup window."""
+    item = ResultItem("Old Article", "https://example.com/old", "Old snippet")
+    item_hash = compute_hash(item.url, item.title)
+    old_timestamp = (datetime.now(timezone.utc) - timedelta(days=20)).isoformat()
+    temp_storage.save_seen({
+        item_hash: {"url": item.url, "title": item.title, "seen_at": old_timestamp, "hash": item_hash}
+    })
+
+    assert temp_storage.batch_is_seen([item]) == [False]
+
+
+def test_load_seen_reuses_parsed_store_until_file_changes(temp_storage, monkeypatch):
+    """Test that load_seen skips re-parsing an unchanged file."""
+    temp_storage.mark_seen([ResultItem("First", "https://example.com/1", "Snippet")])
+
+    calls = []
+    real_loads = json.loads
+    monkeypatch.setattr("src.storage.json.loads", lambda data: calls.append(1) or real_loads(data))
+
+    temp_storage.load_seen()
+    temp_storage.load_seen()
+    assert calls == []
+
+    # An external writer invalidates the cached copy
+    temp_storage.storage_path.write_text(json.dumps({}), encoding="utf-8")
+    assert temp_storage.load_seen() == {}
+    assert calls == [1]
+
+
+# ========== Bloom Filter Tests ==========
+
+def test_bloom_filter_has_no_false_negatives():
+    """Test that every added key is reported as present."""
+    bloom = BloomFilter.for_capacity(1000, error_rate=1e-4)
+    keys = [f"key-{i}" for i in range(1000)]
+    bloom.add_many(keys)
+
+    assert all(key in bloom for key in keys)
+    assert sum(f"other-{i}" in bloom for i in range(1000)) <= 5
+
+
+def test_bloom_filter_save_and_load(tmp_path):
+    """Test that a saved filter round-trips through disk."""
+    bloom = BloomFilter.for_capacity(100)
+    bloom.add("abc")
+    bloom.save(tmp_path / "seen.bloom")
+
+    loaded = BloomFilter.load(tmp_path / "seen.bloom")
+
+    assert loaded is not None
+    assert "abc" in loaded
+    assert loaded.count == 1
+    assert loaded.popcount() == bloom.popcount() == bloom.num_hashes
+    assert BloomFilter.load(tmp_path / "missing.bloom") is None
+
+
+def test_bloom_filter_concurrent_adds_keep_every_key():
+    """Test that adds from several threads never drop bits."""
+    bloom = BloomFilter.for_capacity(4000, error_rate=1e-4)
+    keys = [f"key-{i}" for i in range(4000)]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(bloom.add, keys))
+
+    assert all(key in bloom for key in keys)
+    assert bloom.popcount() == int.from_bytes(bloom._bits, "little").bit_count()
+    assert 0 < bloom.estimated_error_rate() < 1e-3
+
+
+def test_bloom_storage_skips_json_for_new_items(tmp_path, monkeypatch):
+    """Test that bloom misses do not read the JSON store."""
+    storage = BloomSeenStorage(storage_path=tmp_path / "seen.json")
+    storage.mark_seen([ResultItem("Seen", "https://example.com/seen", "Snippet")])
+
+    def fail_load():
+        raise AssertionError("JSON store should not be read")
+
+    monkeypatch.setattr(storage, "load_seen", fail_load)
+
+    assert storage.is_seen(ResultItem("New", "https://example.com/new", "Snippet")) is False
+
+
+def test_bloom_storage_rebuilds_from_existing_json(tmp_path):
+    """Test that a missing filter is rebuilt from the JSON store."""
+    item = ResultItem("Article", "https://example.com/article", "Snippet")
+    SeenStorage(storage_path=tmp_path / "seen.json").mark_seen([item])
+
+    storage = BloomSeenStorage(storage_path=tmp_path / "seen.json")
+
+    assert storage.bloom_path.exists()
+    assert storage.is_seen(item) is True
+
+
+def test_bloom_storage_reset_state(tmp_path):
+    """Test that reset clears both the JSON store and the filter."""
+    item = ResultItem("Article", "https://example.com/article", "Snippet")
+    storage = BloomSeenStorage(storage_path=tmp_path / "seen.json")
+    storage.mark_seen([item])
+
+    storage.reset_state()
+
+    assert not storage.bloom_path.exists()
+    assert storage.is_seen(item) is False
+
+
+def test_bloom_storage_batch_is_seen(tmp_path):
+    """Test that batch lookups through the filter confirm probable hits."""
+    seen = ResultItem("Seen", "https://example.com/seen", "Snippet")
+    new = ResultItem("New", "https://example.com/new", "Snippet")
+    storage = BloomSeenStorage(storage_path=tmp_path / "seen.json")
+    storage.mark_seen([seen])
+
+    assert storage.batch_is_seen([new, seen]) == [False, True]
+
+
+def test_bloom_storage_batch_is_seen_hashes_each_item_once(tmp_path, monkeypatch):
+    """Test that the filter check and JSON confirmation share one digest per item."""
+    seen = ResultItem("Seen", "https://example.com/seen", "Snippet")
+    new = ResultItem("New", "https://example.com/new", "Snippet")
+    storage = BloomSeenStorage(storage_path=tmp_path / "seen.json")
+    storage.mark_seen([seen])
+
+    calls = []
+    monkeypatch.setattr(
+        "src.storage.compute_hash",
+        lambda url, title: calls.append(url) or compute_hash(url, title),
+    )
+
+    assert storage.batch_is_seen([seen, new]) == [True, False]
+    assert calls == [seen.url, new.url]
+
+
+# ========== SQLite Storage Tests ==========
+
+@pytest.fixture
+def sqlite_storage(tmp_path):
+    """Create a temporary SQLite storage."""
+    storage = SqliteSeenStorage(storage_path=tmp_path / "seen.db", dedup_window_days=14)
+    yield storage
+    storage.close()
+
+
+def test_sqlite_storage_mark_and_check(sqlite_storage):
+    """Test that marked items are seen and others are not."""
+    seen = ResultItem("Seen", "https://example.com/seen", "Snippet")
+    new = ResultItem("New", "https://example.com/new", "Snippet")
+    sqlite_storage.mark_seen([seen, seen])
+
+    assert sqlite_storage.is_seen(seen) is True
+    assert sqlite_storage.is_seen(new) is False
+    assert sqlite_storage.batch_is_seen([new, seen]) == [False, True]
+    assert sqlite_storage.get_stats()["total_count"] == 1
+
+
+def test_sqlite_storage_expires_and_cleans_up(sqlite_storage):
+    """Test that records outside the window are unseen and removable."""
+    item = ResultItem("Old", "https://example.com/old", "Snippet")
+    old_ts = int((datetime.now(timezone.utc) - timedelta(days=20)).timestamp())
+    sqlite_storage._conn.execute(
+        "INSERT INTO seen (k, ts) VALUES (?, ?)", (SqliteSeenStorage._key(item), old_ts)
+    )
+
+    assert sqlite_storage.is_seen(item) is False
+    assert sqlite_storage.batch_is_seen([item]) == [False]
+    assert sqlite_storage.cleanup_old_records() == 1
+    assert sqlite_storage.get_stats()["total_count"] == 0
+
+
+def test_sqlite_storage_persists_and_resets(tmp_path):
+    """Test that records survive reopening and are cleared by reset."""
+    item = ResultItem("Article", "https://example.com/article", "Snippet")
+    storage = SqliteSeenStorage(storage_path=tmp_path / "seen.db")
+    storage.mark_seen([item])
+    storage.close()
+
+    reopened = SqliteSeenStorage(storage_path=tmp_path / "seen.db")
+    assert reopened.is_seen(item) is True
+    reopened.reset_state()
+    assert reopened.is_seen(item) is False
+    reopened.close()
+
+
+def test_open_storage_selects_backend_by_suffix(tmp_path):
+    """Test that the storage factory picks SQLite for database suffixes."""
+    sqlite_storage = open_storage(tmp_path / "seen.sqlite")
+    assert isinstance(sqlite_storage, SqliteSeenStorage)
+    sqlite_storage.close()
+
+    assert isinstance(open_storage(tmp_path / "seen.json"), BloomSeenStorage)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -18,6 +18,9 @@ class DummyRepository:
     def is_seen(self, paper_id: str) -> bool:
         return paper_id in self.seen
 
+    def which_seen(self, paper_ids: list[str]) -> set[str]:
+        return {paper_id for paper_id in paper_ids if paper_id in self.seen}
+
     def mark_seen(self, items: list[PaperItem]) -> None:
         for item in items:
             self.seen.add(item.paper_id)
@@ -77,6 +80,7 @@ def test_lambda_handler_smoke_flow(monkeypatch):
     monkeypatch.setattr("src.handler.fetch_pubmed", lambda **_: [])
     monkeypatch.setattr("src.handler.fetch_rss", lambda **_: [])
     monkeypatch.setattr("src.handler.SeenRepository", DummyRepository)
+    monkeypatch.setattr("src.handler._repository", None)
     monkeypatch.setattr("src.handler.utcnow", lambda: now)
 
     def _fake_send_email(items_by_source, *_args, **_kwargs):